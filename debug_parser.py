@@ -1,21 +1,31 @@
 
-import requests
-import json
+import orjson
+from utils.http_session import SESSION
 
 AI_PARSER_URL = "https://parser.simple-flow.co/parse"
 
+def _shorten(value, max_str=120):
+    """Trim long strings/lists so the preview never serializes the full article."""
+    if isinstance(value, str):
+        return value[:max_str]
+    if isinstance(value, list):
+        return [_shorten(v, max_str) for v in value[:3]]
+    if isinstance(value, dict):
+        return {k: _shorten(v, max_str) for k, v in value.items()}
+    return value
+
 def test_url(url, page_type="detail"):
     print(f"Testing {url} ({page_type})...")
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             AI_PARSER_URL,
             json={"url": url, "page_type": page_type},
             timeout=30,
         )
         print(f"Status: {resp.status_code}")
         try:
-            data = resp.json()
-            print(json.dumps(data, indent=2)[:500] + "...")
+            data = orjson.loads(resp.content)
+            print(orjson.dumps(_shorten(data), option=orjson.OPT_INDENT_2).decode()[:500] + "...")
         except:
             print("Response not JSON:", resp.text[:500])
     except Exception as e:
@@ -1,28 +1,32 @@
 """
 NODE: Duplicate Control
-PURPOSE: Two-layer dedup: fast URL check + AI semantic comparison against recent posts.
-         Catches same news from different sources (cross-source dedup).
-INPUT: {article_text, article_title, article_url} (summarized + relevant)
-OUTPUT: article dict (unchanged) or None if duplicate
+PURPOSE: AI semantic comparison against recent posts (URL dedup already happens
+         in the fetch nodes). Catches same news from different sources (cross-source dedup).
+         The whole batch of a pipeline run is checked in ONE LLM call, which also
+         catches duplicates between new articles of the same batch.
+INPUT: List of {article_text, article_title, article_url} (summarized + relevant)
+OUTPUT: List aligned with input: article dict (unchanged) or None if duplicate
 """
 
 # ── AI Configuration ─────────────────────────────────────────
 MODEL = "google/gemini-2.5-flash"
 TEMPERATURE = 0.2
 MAX_TOKENS = 1500
+MAX_TOKENS_PER_ARTICLE = 150  # Added on top of MAX_TOKENS for each article in the batch
 
-PROMPT = """## New article:
-Title: {new_title}
-Text: {new_text}
+# Stable part first: the recent-posts block is identical across runs until a new
+# post is created, so it forms a cacheable prompt prefix with SYSTEM_MESSAGE.
+PROMPT = """## Existing recent posts:
+{existing_posts}
 
-## Existing recent posts:
-{existing_posts}"""
+## New articles:
+{new_articles}"""
 
 SYSTEM_MESSAGE = """## ROLE
 You are a duplicate detector for an AI news channel.
 
 ## TASK
-Compare the new article with the list of existing recent posts. Determine if the new article covers THE SAME specific news event as any existing post.
+You receive a list of existing recent posts and a numbered list of new articles. For EACH new article, determine if it covers THE SAME specific news event as any existing post, or as an EARLIER new article in the list (lower number).
 
 ## WHAT COUNTS AS DUPLICATE:
 - Same product launch/release (even if from different sources with different wording)
@@ -36,16 +40,22 @@ Compare the new article with the list of existing recent posts. Determine if the
 
 ## OUTPUT FORMAT (strict JSON)
 {
-  "article": "the new article text (preserved exactly)",
-  "is_duplicate": true/false,
-  "duplicate_of": "title of the matching existing post, or empty string if not duplicate",
-  "reason": "1-sentence explanation"
+  "results": [
+    {
+      "index": 1,
+      "is_duplicate": true/false,
+      "duplicate_of": "title of the matching post or earlier new article, or empty string if not duplicate",
+      "reason": "1-sentence explanation"
+    }
+  ]
 }
 
 ## RULES
+- Return exactly one entry per new article, using its number as "index"
 - Be strict: only flag as duplicate if it's clearly the SAME specific event
 - Different perspectives on the same event = duplicate
 - Same company but different products = NOT duplicate
+- Among new articles covering the same event, keep the FIRST one and flag the later ones
 - Output ONLY valid JSON"""
 
 # ── Implementation ────────────────────────────────────────────
@@ -55,38 +65,46 @@ from utils.telegram_error import send_error
 from utils import notion_client
 
 
-def execute(article: dict) -> dict | None:
+def _format_recent(recent: list[dict]) -> str:
+    """Format recent posts as the (stable) prompt prefix block."""
+    if not recent:
+        return "(none)"
+    return "".join(
+        f"\n{i}. Title: {post['title']}\n   Text: {post.get('post_text', '')}\n"
+        for i, post in enumerate(recent, 1)
+    )
+
+
+def execute_batch(articles: list[dict]) -> list[dict | None]:
     """
-    Check if an article is a duplicate of recent posts.
+    Check a batch of articles for duplicates against recent posts and each other.
 
     Args:
-        article: {article_text, article_title, article_url, ...}
+        articles: [{article_text, article_title, article_url, ...}, ...]
 
     Returns:
-        Article unchanged if not duplicate, None if duplicate.
+        List aligned with `articles`: article unchanged if not duplicate, None if duplicate.
     """
-    try:
-        # Layer 1: URL check (already done in fetch nodes, but double-check)
-        if notion_client.url_exists(article["article_url"]):
-            log_info(f"[Dedup] ✗ URL already exists: {article['article_url']}")
-            return None
+    results = list(articles)
+
+    if not articles:
+        return results
 
-        # Layer 2: AI semantic comparison
+    try:
         recent = notion_client.get_recent_articles(days=3)
 
-        if not recent:
+        if not recent and len(articles) == 1:
             log_debug("[Dedup] No recent articles to compare against")
-            return article
+            return results
 
-        # Format existing posts for the prompt
-        existing_text = ""
-        for i, post in enumerate(recent, 1):
-            existing_text += f"\n{i}. Title: {post['title']}\n   Text: {post.get('post_text', '')[:200]}\n"
+        # Format existing posts and new articles for the prompt
+        new_text = ""
+        for n, article in enumerate(articles, 1):
+            new_text += f"\n{n}. Title: {article.get('article_title', '')}\n   Text: {article['article_text'][:1000]}\n"
 
         prompt = PROMPT.format(
-            new_title=article.get("article_title", ""),
-            new_text=article["article_text"][:1000],
-            existing_posts=existing_text,
+            existing_posts=_format_recent(recent),
+            new_articles=new_text,
         )
 
         result = chat_completion(
@@ -94,26 +112,49 @@ def execute(article: dict) -> dict | None:
             system_message=SYSTEM_MESSAGE,
             model=MODEL,
             temperature=TEMPERATURE,
-            max_tokens=MAX_TOKENS,
+            max_tokens=MAX_TOKENS + MAX_TOKENS_PER_ARTICLE * len(articles),
             json_mode=True,
         )
 
-        is_duplicate = result.get("is_duplicate", False)
-        reason = result.get("reason", "")
-
-        if is_duplicate:
-            dup_of = result.get("duplicate_of", "")
-            log_info(f"[Dedup] ✗ Duplicate of '{dup_of}': {article.get('article_title', 'Unknown')} — {reason}")
-            return None
-
-        log_info(f"[Dedup] ✓ Not duplicate: {article.get('article_title', 'Unknown')}")
-        return article
+        verdicts = {}
+        for item in result.get("results", []):
+            try:
+                verdicts[int(item.get("index"))] = item
+            except (TypeError, ValueError):
+                continue
+
+        for i, article in enumerate(articles):
+            title = article.get("article_title", "Unknown")
+            verdict = verdicts.get(i + 1)
+            if verdict is None:
+                # Missing verdict: allow through (fail-open)
+                log_debug(f"[Dedup] No verdict for '{title}', allowing through")
+                continue
+
+            if verdict.get("is_duplicate", False):
+                dup_of = verdict.get("duplicate_of", "")
+                log_info(f"[Dedup] ✗ Duplicate of '{dup_of}': {title} — {verdict.get('reason', '')}")
+                results[i] = None
+            else:
+                log_info(f"[Dedup] ✓ Not duplicate: {title}")
+
+        return results
 
     except Exception as e:
         log_info(f"[Dedup] Error (allowing through): {e}")
         send_error(str(e), node_name="duplicate_control")
-        # On error, allow the article through (fail-open)
-        return article
+        # On error, allow the articles through (fail-open)
+        return results
+
+
+def execute(article: dict) -> dict | None:
+    """
+    Check if a single article is a duplicate of recent posts.
+
+    Returns:
+        Article unchanged if not duplicate, None if duplicate.
+    """
+    return execute_batch([article])[0]
 
 
 # ── Standalone test ──────────────────────────────────────────
@@ -4,94 +4,63 @@ PURPOSE: Polls RSS feeds (marktechpost, techcrunch, theverge), parses new articl
          via AI parser microservice, and normalizes output.
 INPUT: None (triggered by scheduler)
 OUTPUT: List of article dicts: {article_text, article_url, article_date, images, videos}
-DEPENDENCIES: feedparser, requests
+DEPENDENCIES: feedparser, requests (via utils/parser_client)
 """
 
+import json
+import os
 import ssl
 import certifi
 import feedparser
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
 # Fix macOS SSL certificate issue for feedparser/urllib
 ssl._create_default_https_context = lambda: ssl.create_default_context(cafile=certifi.where())
 
-from utils.config import RSS_FEEDS, AI_PARSER_URL, TAVILY_API_KEY
+from utils.config import RSS_FEEDS, MAX_ARTICLE_CHARS, DATA_DIR
 from utils.logger import log_info, log_error, log_debug
-import time
-from utils import notion_client
+from utils import notion_cache, parser_client
+from utils.text_clean import clean
 
+MAX_FETCH_WORKERS = 8  # Concurrent feed downloads / parser calls
+
+# Per-feed state ({source: {etag, modified, handled}}): HTTP validators so unchanged
+# feeds answer 304, and the ids of top entries already handled (turned into an
+# article or deliberately rejected) so they are skipped; failed entries are retried
+STATE_FILE = os.path.join(DATA_DIR, "rss_state.json")
 
-def _tavily_extract(article_url: str) -> dict | None:
-    """Fallback: use Tavily to extract article content."""
-    if not TAVILY_API_KEY:
-        log_debug("Tavily API key not set, skipping fallback")
-        return None
 
+def _load_state() -> dict:
+    """Load persisted per-feed state (empty on first run or unreadable file)."""
     try:
-        resp = requests.post(
-            "https://api.tavily.com/extract",
-            json={"api_key": TAVILY_API_KEY, "urls": [article_url]},
-            timeout=60,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-
-        results = data.get("results", [])
-        if results:
-            return {
-                "full_text": results[0].get("raw_content", ""),
-                "images": [],
-                "videos": [],
-            }
-        return None
+        with open(STATE_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
     except Exception as e:
-        log_error(f"Tavily extract failed for {article_url}: {e}")
-        return None
+        log_error(f"Could not read RSS state file: {e}")
+        return {}
 
 
-def _parse_article_detail(article_url: str, max_retries: int = 2) -> dict | None:
-    """Call AI parser to get full article content. Retries on transient failures."""
-    for attempt in range(1, max_retries + 1):
-        try:
-            resp = requests.post(
-                AI_PARSER_URL,
-                json={"url": article_url, "page_type": "detail"},
-                timeout=90,
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            if data.get("ok") and data.get("data"):
-                return data["data"]
-
-            error_msg = data.get("error", "Unknown parser error")
-            log_error(f"Parser returned error for {article_url}: {error_msg}")
-            return None
-        except Exception as e:
-            log_error(f"AI parser failed (attempt {attempt}/{max_retries}) for {article_url}: {e}")
-            if attempt < max_retries:
-                time.sleep(3)
-    return None
-
-
-def _normalize_rss_article(entry: dict, source_name: str) -> dict | None:
-    """
-    Process a single RSS entry:
-    1. Check Notion for URL dedup
-    2. Parse via AI parser for full text + images/videos
-    3. Return normalized payload
-    """
-    article_url = entry.get("link", "")
-
-    if not article_url:
-        return None
+def _save_state(state: dict) -> None:
+    """Persist per-feed state atomically."""
+    try:
+        tmp_path = STATE_FILE + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, STATE_FILE)
+    except Exception as e:
+        log_error(f"Could not write RSS state file: {e}")
 
-    # URL-based dedup
-    if notion_client.url_exists(article_url):
-        log_debug(f"[{source_name}] Already in Notion: {article_url}")
-        return None
 
+def _normalize_rss_article(entry: dict, source_name: str, fetched_at: str) -> dict | None:
+    """
+    Process a single new RSS entry (see _safe_normalize for dedup):
+    1. Parse via AI parser for full text + images/videos
+    2. Return normalized payload, or None if no text could be extracted
+    """
+    article_url = entry["link"]
     log_info(f"[{source_name}] New article: {article_url}")
 
     # For marktechpost, we can use content:encoded from RSS
@@ -103,7 +72,7 @@ def _normalize_rss_article(entry: dict, source_name: str) -> dict | None:
             rss_text = entry.get("summary", "")
 
     # Parse via AI parser for full text + images/videos
-    parsed = _parse_article_detail(article_url)
+    parsed = parser_client.parse_detail(article_url)
 
     article_text = ""
     images = []
@@ -117,7 +86,7 @@ def _normalize_rss_article(entry: dict, source_name: str) -> dict | None:
     # Fallback: Use Tavily if parser failed
     if not article_text and not rss_text:
         log_info(f"[{source_name}] Parser failed, trying Tavily fallback")
-        tavily_data = _tavily_extract(article_url)
+        tavily_data = parser_client.tavily_extract(article_url)
         if tavily_data:
             article_text = tavily_data.get("full_text", "")
 
@@ -125,45 +94,121 @@ def _normalize_rss_article(entry: dict, source_name: str) -> dict | None:
     if not article_text and rss_text:
         article_text = rss_text
 
+    article_text = clean(article_text)  # Before the MAX_ARTICLE_CHARS cut
     if not article_text:
         log_debug(f"[{source_name}] No text extracted for {article_url}")
         return None
 
     return {
-        "article_text": article_text,
+        "article_text": article_text[:MAX_ARTICLE_CHARS],
         "article_url": article_url,
-        "article_date": datetime.now(timezone.utc).isoformat(),
+        "article_date": fetched_at,
         "images": images if images else [],
         "videos": videos if videos else [],
         "source": source_name,
     }
 
 
+def _entry_id(entry: dict) -> str:
+    """Stable identifier of an RSS entry (guid, falling back to its link)."""
+    return entry.get("id") or entry.get("link", "")
+
+
+def _fetch_feed(source_name: str, feed_url: str, prev: dict) -> tuple[list[dict], dict]:
+    """
+    Download and parse a single RSS feed with a conditional GET.
+    Returns (latest entries, feed state to remember). No entries if unchanged (HTTP 304).
+    """
+    try:
+        log_info(f"Fetching RSS: {source_name}")
+        feed = feedparser.parse(feed_url, etag=prev.get("etag"), modified=prev.get("modified"))
+
+        if feed.get("status") == 304:
+            log_debug(f"[{source_name}] Feed not modified since last poll")
+            return [], prev
+
+        if feed.bozo and not feed.entries:
+            log_error(f"RSS feed error for {source_name}: {feed.bozo_exception}")
+            return [], prev
+
+        # Process the latest 5 entries to avoid missing articles published closely together,
+        # skipping those handled on an earlier poll. An entry that failed stays unhandled
+        # and is retried while it is in the top 5. Deduplication against Notion covers the rest.
+        handled = set(prev.get("handled", []))
+        top = feed.entries[:5]
+        entries = [entry for entry in top if _entry_id(entry) not in handled]
+
+        state = {
+            "etag": feed.get("etag"),
+            "modified": feed.get("modified"),
+            # Only ids still in the top 5 are kept, so the list stays bounded
+            "handled": [_entry_id(entry) for entry in top if _entry_id(entry) in handled],
+        }
+        return entries, state
+
+    except Exception as e:
+        log_error(f"[{source_name}] RSS fetch failed: {e}")
+        return [], prev
+
+
+def _safe_normalize(entry: dict, source_name: str, fetched_at: str) -> tuple[dict | None, bool]:
+    """
+    Dedup and normalize one entry without raising (one bad entry must not sink the batch).
+    Returns (article or None, handled). Not handled = failed; retried on the next poll.
+    """
+    article_url = entry.get("link", "")
+    try:
+        # URL-based dedup (cached set of Notion URLs): a deliberate rejection
+        if not article_url or notion_cache.is_known(article_url):
+            log_debug(f"[{source_name}] No link or already in Notion: {article_url}")
+            return None, True
+
+        article = _normalize_rss_article(entry, source_name, fetched_at)
+        return article, article is not None
+    except Exception as e:
+        log_error(f"[{source_name}] RSS entry processing failed: {e}")
+        return None, False
+
+
 def execute() -> list[dict]:
     """
     Fetch and process all RSS feeds.
+    Feeds are downloaded concurrently, then every entry is parsed concurrently
+    (pure network I/O, so total latency ≈ the slowest single source).
+
     Returns list of normalized article payloads.
     """
-    articles = []
-
-    for source_name, feed_url in RSS_FEEDS.items():
-        try:
-            log_info(f"Fetching RSS: {source_name}")
-            feed = feedparser.parse(feed_url)
-
-            if feed.bozo and not feed.entries:
-                log_error(f"RSS feed error for {source_name}: {feed.bozo_exception}")
-                continue
-
-            # Process the latest 5 entries to avoid missing articles published closely together.
-            # Deduplication against Notion prevents reprocessing old ones.
-            for entry in feed.entries[:5]:
-                result = _normalize_rss_article(entry, source_name)
-                if result:
-                    articles.append(result)
-
-        except Exception as e:
-            log_error(f"[{source_name}] RSS fetch failed: {e}")
+    state = _load_state()
+    fetched_at = datetime.now(timezone.utc).isoformat()  # Shared by every article of this poll
+
+    with ThreadPoolExecutor(max_workers=MAX_FETCH_WORKERS) as pool:
+        feeds = list(pool.map(
+            lambda item: _fetch_feed(*item, state.get(item[0], {})),
+            RSS_FEEDS.items(),
+        ))
+
+        jobs = [
+            (entry, source_name)
+            for source_name, (entries, _) in zip(RSS_FEEDS.keys(), feeds)
+            for entry in entries
+        ]
+        results = list(pool.map(lambda job: _safe_normalize(*job, fetched_at), jobs))
+        articles = [article for article, _ in results if article]
+
+    # Remember feed state only once its entries have been processed
+    feed_states = {
+        source_name: feed_state for source_name, (_, feed_state) in zip(RSS_FEEDS.keys(), feeds)
+    }
+    for (entry, source_name), (_, handled) in zip(jobs, results):
+        feed_state = feed_states[source_name]
+        if handled:
+            feed_state["handled"].append(_entry_id(entry))
+        else:
+            # Keep the old validators so the next poll gets the entries again instead of a 304
+            prev = state.get(source_name, {})
+            feed_state["etag"], feed_state["modified"] = prev.get("etag"), prev.get("modified")
+    state.update(feed_states)
+    _save_state(state)
 
     log_info(f"RSS feeds: {len(articles)} new article(s) found")
     return articles
@@ -5,17 +5,21 @@ PURPOSE: Determines the best image/video for the post.
          Step 2: If no video, call image-finder microservice
 INPUT: Original article data with images/videos
 OUTPUT: {creative_type, creative_url} — "video"|"image"|"none"
-DEPENDENCIES: requests
+DEPENDENCIES: requests (via utils/http_session), orjson
 """
 
-import requests
+import orjson
+
 from utils.config import IMAGE_FINDER_URL
 from utils.logger import log_info, log_error, log_debug
 from utils.telegram_error import send_error
+from utils.http_session import SESSION, CONNECT_TIMEOUT
+
+IMAGE_FINDER_TIMEOUT = 120  # Read timeout — the finder searches and ranks images
 
 
-def _prepare_images_string(images: list) -> str:
-    """Convert images list to comma-separated URL string (matching n8n Prepare images node)."""
+def _collect_image_urls(images: list) -> list[str]:
+    """Collect non-empty, stripped image URLs (matching n8n Prepare images node)."""
     urls = []
     for img in images:
         if isinstance(img, dict):
@@ -26,33 +30,34 @@ def _prepare_images_string(images: list) -> str:
             continue
         if url and url.strip():
             urls.append(url.strip())
-    return ",".join(urls)
+    return urls
+
+
+def _video_url(video) -> str:
+    """Clean URL of a usable video entry, or "" (dicts must have URL and description)."""
+    if isinstance(video, dict):
+        url = video.get("url", "").strip()
+        return url if url and video.get("description", "").strip() else ""
+    if isinstance(video, str):
+        return video.strip()
+    return ""
 
 
 def _find_video(videos: list) -> str | None:
-    """Check for valid video (must have URL and description)."""
+    """Return the first valid video URL, if any."""
     if not videos or not isinstance(videos, list):
         return None
 
-    for video in videos:
-        if isinstance(video, dict):
-            url = video.get("url", "").strip()
-            desc = video.get("description", "").strip()
-            if url and desc:
-                log_info(f"[Creative] Video found: {url}")
-                return url
-        elif isinstance(video, str) and video.strip():
-            log_info(f"[Creative] Video URL found: {video}")
-            return video.strip()
-
-    return None
+    url = next((u for u in map(_video_url, videos) if u), None)
+    if url:
+        log_info(f"[Creative] Video found: {url}")
+    return url
 
 
 def _find_image(title: str, article_text: str, source_url: str, images: list) -> str | None:
     """Call image-finder microservice to find the best image."""
     try:
-        images_str = _prepare_images_string(images)
-        images_list = [u for u in images_str.split(",") if u]
+        images_list = _collect_image_urls(images)
 
         payload = {
             "title": title,
@@ -63,9 +68,14 @@ def _find_image(title: str, article_text: str, source_url: str, images: list) ->
             payload["images"] = images_list
 
         log_debug(f"[Creative] Calling image-finder with title='{title}'")
-        resp = requests.post(IMAGE_FINDER_URL, json=payload, timeout=120)
+        resp = SESSION.post(
+            IMAGE_FINDER_URL,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            timeout=(CONNECT_TIMEOUT, IMAGE_FINDER_TIMEOUT),
+        )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
 
         image_url = data.get("image_url", "")
         if image_url:
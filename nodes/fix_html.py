@@ -10,6 +10,50 @@ import re
 from utils.config import EN_SIGNATURE
 from utils.logger import log_debug
 
+# ── Patterns (compiled once at import) ───────────────────────
+_P_OPEN = re.compile(r"<p>")
+_P_CLOSE = re.compile(r"</p>")
+_BR = re.compile(r"<br\s*/?>")
+_BLANKS = re.compile(r"\n{3,}")
+
+# Tags Telegram's HTML parse mode accepts; everything else is stripped
+_ALLOWED = frozenset({"b", "i", "u", "s", "code", "pre", "a"})
+
+
+def _is_word_char(c: str) -> bool:
+    """Same as regex \\w for a single character."""
+    return c.isalnum() or c == "_"
+
+
+def _strip_unsupported(text: str) -> str:
+    """
+    Remove HTML tags whose name is not in _ALLOWED, keeping their content.
+    Single str.find() pass (no regex callback per tag). A tag is "<", optional
+    "/", a word character, then anything up to the next ">" — text such as
+    "a < b" is left untouched.
+    """
+    out = []
+    i = 0
+    while (j := text.find("<", i)) != -1:
+        k = text.find(">", j + 1)
+        if k == -1:
+            break  # No closing ">" left, so no more tags
+
+        name_start = j + 2 if text.startswith("/", j + 1) else j + 1
+        if name_start >= k or not _is_word_char(text[name_start]):
+            # Not a tag: keep the "<" and continue right after it
+            out.append(text[i:j + 1])
+            i = j + 1
+            continue
+
+        out.append(text[i:j])
+        if text[j + 1:k].split()[0].strip("/").lower() in _ALLOWED:
+            out.append(text[j:k + 1])
+        i = k + 1
+
+    out.append(text[i:])
+    return "".join(out)
+
 
 def execute(post_text: str) -> str:
     """
@@ -25,25 +69,18 @@ def execute(post_text: str) -> str:
     text = post_text
 
     # Replace <p> tags with double line breaks
-    text = re.sub(r"<p>", "", text)
-    text = re.sub(r"</p>", "\n\n", text)
+    text = _P_OPEN.sub("", text)
+    text = _P_CLOSE.sub("\n\n", text)
 
     # Normalize <br> variants
-    text = re.sub(r"<br\s*/?>", "\n", text)
+    text = _BR.sub("\n", text)
 
     # Remove unsupported tags (keep: b, i, u, s, code, pre, a)
     # Strip any other HTML tags
-    allowed_tags = {"b", "i", "u", "s", "code", "pre", "a"}
-    def _strip_unsupported(match):
-        tag = match.group(1).split()[0].strip("/").lower()
-        if tag in allowed_tags:
-            return match.group(0)
-        return ""
-
-    text = re.sub(r"<(/?\w[^>]*)>", _strip_unsupported, text)
+    text = _strip_unsupported(text)
 
     # Normalize consecutive blank lines (max 2 newlines)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _BLANKS.sub("\n\n", text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
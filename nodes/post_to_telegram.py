@@ -5,22 +5,27 @@ PURPOSE: Admin preview → approval (inline buttons) → post to main channel.
 INPUT: {post_text, creative_type, creative_url, notion_page_id, article_title}
 OUTPUT: {approved: bool, post_url: str, message_id: int} or None
 
-NOTE: This node is designed to be called from main.py where the Telegram
-      Application is running. The approval flow uses a pending_posts dict
-      to track posts awaiting approval.
+NOTE: This node is designed to be called from orchestrator.py where the Telegram
+      Application is running. The approval flow uses a pending_posts store
+      (SQLite, survives restarts) to track posts awaiting approval.
 """
 
 import asyncio
-import aiohttp
-from io import BytesIO
+import os
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
-from utils.config import TELEGRAM_BOT_TOKEN, ADMIN_CHANNEL_ID, MAIN_CHANNEL_ID
+from utils.config import TELEGRAM_BOT_TOKEN, ADMIN_CHANNEL_ID, MAIN_CHANNEL_ID, DATA_DIR
 from utils.logger import log_info, log_error
 from utils.telegram_error import send_error
+from utils.tg_send import send_post
+from utils.pending_store import PendingStore
 
 # ── Shared state for pending approvals ───────────────────────
 # Key: unique callback ID, Value: article data dict
-pending_posts: dict[str, dict] = {}
+# Persisted in SQLite so approvals survive a restart. Expiring: posts nobody
+# clicks on fall out after 24h and are recovered from Notion if the buttons
+# are pressed later (stateless fallback).
+PENDING_DB = os.path.join(DATA_DIR, "pending_posts.db")
+pending_posts = PendingStore(PENDING_DB, ttl=86400)
 
 
 def _build_keyboard(callback_id: str) -> InlineKeyboardMarkup:
@@ -57,57 +62,11 @@ async def send_preview(bot, article_data: dict) -> str | None:
         creative_type = article_data.get("creative_type", "none")
         creative_url = article_data.get("creative_url", "none")
 
-        if creative_type == "video" and creative_url and creative_url != "none":
-            await bot.send_video(
-                chat_id=ADMIN_CHANNEL_ID,
-                video=creative_url,
-                caption=post_text,
-                parse_mode="HTML",
-            )
-        elif creative_type == "image" and creative_url and creative_url != "none":
-            # Download and send as bytes to bypass Telegram fetch errors
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        creative_url,
-                        timeout=aiohttp.ClientTimeout(total=30),
-                        headers={"User-Agent": "Mozilla/5.0"},
-                        ssl=False,
-                    ) as img_resp:
-                        img_resp.raise_for_status()
-                        img_data = await img_resp.read()
-                photo_bytes = BytesIO(img_data)
-                photo_bytes.name = "preview.jpg"
-                await bot.send_photo(
-                    chat_id=ADMIN_CHANNEL_ID,
-                    photo=photo_bytes,
-                    caption=post_text,
-                    parse_mode="HTML",
-                )
-            except Exception as img_err:
-                log_error(f"[Telegram] Preview image download failed, trying plain URL or text: {img_err}")
-                try:
-                    await bot.send_photo(
-                        chat_id=ADMIN_CHANNEL_ID,
-                        photo=creative_url,
-                        caption=post_text,
-                        parse_mode="HTML",
-                    )
-                except Exception as tg_err:
-                    log_error(f"[Telegram] Preview photo URL also failed, sending text only: {tg_err}")
-                    await bot.send_message(
-                        chat_id=ADMIN_CHANNEL_ID,
-                        text=f"[Image omitted due to fetch error]\n\n{post_text}",
-                        parse_mode="HTML",
-                        disable_web_page_preview=True,
-                    )
-        else:
-            await bot.send_message(
-                chat_id=ADMIN_CHANNEL_ID,
-                text=post_text,
-                parse_mode="HTML",
-                disable_web_page_preview=True,
-            )
+        # Falls back to plain URL, then to text only, so the admin always gets a preview
+        await send_post(
+            bot, ADMIN_CHANNEL_ID, post_text, creative_type, creative_url,
+            photo_name="preview.jpg", text_fallback=True, insecure_fallback=True,
+        )
 
         # Send approval message right after the preview
         await bot.send_message(
@@ -116,8 +75,8 @@ async def send_preview(bot, article_data: dict) -> str | None:
             reply_markup=keyboard,
         )
 
-        # Store in pending (memory cache)
-        pending_posts[callback_id] = article_data
+        # Store in pending (persistent)
+        pending_posts.put(callback_id, article_data)
         log_info(f"[Telegram] Preview sent for '{article_data.get('article_title', '')}' (id: {callback_id})")
         return callback_id
 
@@ -139,50 +98,7 @@ async def post_to_main_channel(bot, article_data: dict) -> dict | None:
         creative_type = article_data.get("creative_type", "none")
         creative_url = article_data.get("creative_url", "none")
 
-        result = None
-
-        if creative_type == "video" and creative_url and creative_url != "none":
-            result = await bot.send_video(
-                chat_id=MAIN_CHANNEL_ID,
-                video=creative_url,
-                caption=post_text,
-                parse_mode="HTML",
-            )
-        elif creative_type == "image" and creative_url and creative_url != "none":
-            # Download image asynchronously to avoid blocking the event loop
-            try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        creative_url,
-                        timeout=aiohttp.ClientTimeout(total=30),
-                        headers={"User-Agent": "Mozilla/5.0"},
-                        ssl=False,
-                    ) as img_resp:
-                        img_resp.raise_for_status()
-                        img_data = await img_resp.read()
-                photo_bytes = BytesIO(img_data)
-                photo_bytes.name = "cover.jpg"
-                result = await bot.send_photo(
-                    chat_id=MAIN_CHANNEL_ID,
-                    photo=photo_bytes,
-                    caption=post_text,
-                    parse_mode="HTML",
-                )
-            except Exception as img_err:
-                log_error(f"[Telegram] Image download failed, trying URL: {img_err}")
-                result = await bot.send_photo(
-                    chat_id=MAIN_CHANNEL_ID,
-                    photo=creative_url,
-                    caption=post_text,
-                    parse_mode="HTML",
-                )
-        else:
-            result = await bot.send_message(
-                chat_id=MAIN_CHANNEL_ID,
-                text=post_text,
-                parse_mode="HTML",
-                disable_web_page_preview=True,
-            )
+        result = await send_post(bot, MAIN_CHANNEL_ID, post_text, creative_type, creative_url)
 
         if result:
             message_id = result.message_id
@@ -14,8 +14,6 @@ MODEL = "anthropic/claude-sonnet-4.5"
 TEMPERATURE = 0.7
 MAX_TOKENS = 1500
 
-PROMPT = "{article_text}"
-
 SYSTEM_MESSAGE = """You write short news updates for the English-language Telegram channel @aiflowdaily — a professional digest covering new AI tools, research, and automation.
 
 Tone: confident, human, concise.
@@ -154,11 +152,27 @@ Provide a short, human-sounding update that explains **one main thing** that hap
 
 **Today's date:** {today}"""
 
+# Split once at import: per call only the date is spliced in (no template pass over ~5 KB)
+_SYS_PREFIX, _, _SYS_SUFFIX = SYSTEM_MESSAGE.partition("{today}")
+
 # ── Implementation ────────────────────────────────────────────
 from utils.openrouter_client import chat_completion
 from utils.logger import log_info, log_error
 from utils.telegram_error import send_error
 
+# System prompt for the current UTC day; rebuilt only when the date changes
+_TODAY_CACHE = {"day": None, "system": ""}
+
+
+def _system_message() -> str:
+    """SYSTEM_MESSAGE with today's date filled in (cached per day)."""
+    now = datetime.now(timezone.utc)
+    day = now.toordinal()
+    if day != _TODAY_CACHE["day"]:
+        # system first, then day: a concurrent reader never pairs a new day with an old prompt
+        _TODAY_CACHE.update(system=_SYS_PREFIX + now.strftime("%Y-%m-%d") + _SYS_SUFFIX, day=day)
+    return _TODAY_CACHE["system"]
+
 
 def execute(article: dict) -> str | None:
     """
@@ -171,11 +185,11 @@ def execute(article: dict) -> str | None:
         Post text (HTML string) or None on failure.
     """
     try:
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        system = SYSTEM_MESSAGE.format(today=today)
+        system = _system_message()
+        prompt = article["article_text"]  # The article is the whole user prompt
 
         result = chat_completion(
-            prompt=PROMPT.format(article_text=article["article_text"]),
+            prompt=prompt,
             system_message=system,
             model=MODEL,
             temperature=TEMPERATURE,
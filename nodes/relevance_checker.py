@@ -11,8 +11,7 @@ MODEL = "openai/gpt-4.1-mini"
 TEMPERATURE = 0.3
 MAX_TOKENS = 1500
 
-PROMPT = """## Article text:
-{article_text}"""
+PROMPT_PREFIX = "## Article text:\n"  # Prompt is PROMPT_PREFIX + article text
 
 SYSTEM_MESSAGE = """## ROLE
 You are a relevance filter for an AI-focused Telegram channel called AI Flow Daily (short: AIF). AIF covers tools and tech that help people work with AI.
@@ -64,8 +63,9 @@ def execute(article: dict) -> dict | None:
         Article with 'relevance_reason' added, or None if not relevant.
     """
     try:
-        prompt = PROMPT.format(article_text=article["article_text"])
+        prompt = PROMPT_PREFIX + article["article_text"]
 
+        # TEMPERATURE is low enough for chat_completion to cache the verdict
         result = chat_completion(
             prompt=prompt,
             system_message=SYSTEM_MESSAGE,
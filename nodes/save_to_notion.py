@@ -6,7 +6,7 @@ INPUT: Article data + post details from pipeline
 OUTPUT: Notion page_id or None
 """
 
-from utils import notion_client
+from utils import notion_client, notion_cache
 from utils.logger import log_info
 
 
@@ -18,7 +18,7 @@ def create_row(
     why_relevant: str,
 ) -> str | None:
     """Create a new article row in Notion with 'Sent for approval' status."""
-    return notion_client.create_article_page(
+    page_id = notion_client.create_article_page(
         title=title,
         article_url=article_url,
         creative_url=creative_url,
@@ -26,6 +26,9 @@ def create_row(
         why_relevant=why_relevant,
         status="Sent for approval",
     )
+    if page_id:
+        notion_cache.add(article_url)  # Known to dedup before the next cache refresh
+    return page_id
 
 
 def mark_posted(page_id: str, post_url: str) -> bool:
@@ -10,9 +10,9 @@ OUTPUT: {article_title, article_text} (summarized) or None if irrelevant/empty
 MODEL = "google/gemini-2.5-flash"
 TEMPERATURE = 0.2
 MAX_TOKENS = 2000
+MIN_ARTICLE_CHARS = 200  # Shorter texts are SKIPped by the model anyway (RSS teasers can be ~300)
 
-PROMPT = """## Article text:
-{article_text}"""
+PROMPT_PREFIX = "## Article text:\n"  # Prompt is PROMPT_PREFIX + article text
 
 SYSTEM_MESSAGE = """## ROLE  
 You are an AI news analyst. Your ONLY task is to process AI-related articles: first summarize them, then check relevance.
@@ -46,11 +46,61 @@ If invalid:
 - Output ONLY valid JSON, nothing else."""
 
 # ── Implementation ────────────────────────────────────────────
+import re
+
+from utils.config import MAX_INPUT_TOKENS
 from utils.openrouter_client import chat_completion
 from utils.logger import log_info, log_debug
 from utils.telegram_error import send_error
 
 
+def _token_cost(char: str) -> float:
+    """
+    Rough tokens per character: ~4 ASCII chars, ~2 Cyrillic/Greek/etc., 1 CJK char per token.
+    The ASCII rate bounds MAX_ARTICLE_CHARS (utils/config): keep the two in sync.
+    """
+    code = ord(char)
+    if code < 0x80:
+        return 0.25
+    if code < 0x3000:
+        return 0.5
+    return 1.0
+
+
+def _trim_to_tokens(text: str, max_tokens: int = MAX_INPUT_TOKENS) -> str:
+    """Cut text to an estimated token budget (a plain char cut over-sends on CJK text)."""
+    if text.isascii():
+        return text[:max_tokens * 4]  # Fast path: the usual English article
+
+    budget = float(max_tokens)
+    for i, char in enumerate(text):
+        budget -= _token_cost(char)
+        if budget < 0:
+            return text[:i]
+    return text
+
+
+# Pre-check: an article naming none of these cannot pass the AI-only filter.
+# ASCII-letter boundaries, not \b: CJK characters count as word characters, so
+# \b would never match "AI" inside "字节跳动的AI视频生成工具".
+_AI_RE = re.compile(
+    r"(?<![A-Za-z])(?:AI|A\.I\.|LLMs?|GPT|ChatGPT|Claude|Gemini|Copilot|models?|OpenAI|Anthropic|Google|Meta|"
+    r"Microsoft|Nvidia|neural|agents?|agentic|chips?|machine learning|deep learning|robots?|automation)(?![A-Za-z])",
+    re.IGNORECASE,
+)
+LATIN_TEXT_RATIO = 0.9  # Keyword gate applies only to text this ASCII-heavy (English keywords)
+
+
+def _precheck_skip_reason(text: str) -> str | None:
+    """Why the article can be skipped without an LLM call, or None to summarize it."""
+    if len(text) < MIN_ARTICLE_CHARS:
+        return f"too short ({len(text)} chars)"
+    is_latin = len(text.encode("ascii", "ignore")) >= LATIN_TEXT_RATIO * len(text)
+    if is_latin and not _AI_RE.search(text):
+        return "no AI keywords"
+    return None
+
+
 def execute(article: dict) -> dict | None:
     """
     Summarize an article's content.
@@ -62,7 +112,13 @@ def execute(article: dict) -> dict | None:
         Updated article with summarized text and title, or None if SKIP.
     """
     try:
-        prompt = PROMPT.format(article_text=article["article_text"][:8000])
+        article_text = _trim_to_tokens(article.get("article_text") or "")
+        reason = _precheck_skip_reason(article_text)
+        if reason:
+            log_info(f"[Summarizer] Skipped before LLM ({reason}): {article['article_url']}")
+            return None
+
+        prompt = PROMPT_PREFIX + article_text
 
         result = chat_completion(
             prompt=prompt,
@@ -7,11 +7,20 @@ OUTPUT: Polished Russian post text (HTML) or original if already good
 """
 
 # ── AI Configuration ─────────────────────────────────────────
-MODEL = "anthropic/claude-sonnet-4.5"
+MODEL = "google/gemini-2.5-flash"  # Polishing only — a fast model is enough
 TEMPERATURE = 0.5
-MAX_TOKENS = 1500
+MAX_TOKENS = 800  # Floor; posts are <= ~700 chars, Cyrillic + HTML tags run ~2-3 chars per token
+TOKEN_HEADROOM = 400  # JSON wrapper + any reasoning tokens the model spends first
 
-PROMPT = "Post text: {post_text}"
+PROMPT_PREFIX = "Post text: "  # Prompt is PROMPT_PREFIX + post text
+
+# Strict structured output: exactly {"post_text": "..."}, nothing around it
+POST_SCHEMA = {
+    "type": "object",
+    "properties": {"post_text": {"type": "string"}},
+    "required": ["post_text"],
+    "additionalProperties": False,
+}
 
 SYSTEM_MESSAGE = """You are a Russian copywriting editor. You receive a Russian Telegram post and must review it for natural, native-quality Russian.
 
@@ -42,11 +51,31 @@ Your output must be a single JSON object:
 No explanations. No comments. Only valid JSON with the polished Russian text."""
 
 # ── Implementation ────────────────────────────────────────────
-from utils.openrouter_client import chat_completion
+from utils.openrouter_client import chat_completion, TruncatedResponseError
 from utils.logger import log_info, log_error
 from utils.telegram_error import send_error
 
 
+def _max_tokens(post_text: str) -> int:
+    """
+    Output cap sized from the input: one token per input character is ~2x the
+    Russian output's tokens, so a long post is not cut off inside the JSON.
+    """
+    return max(MAX_TOKENS, len(post_text) + TOKEN_HEADROOM)
+
+# Cheap pre-check: the review is skipped for translations that look clean
+MIN_CLEAN_CHARS = 200
+MAX_CLEAN_CHARS = 900
+SUSPICIOUS_MARKERS = ("  ", " ,", " .")  # Typical artefacts of a rough translation
+
+
+def _needs_review(text: str) -> bool:
+    """True if the translation is an unusual length or shows spacing artefacts."""
+    if not MIN_CLEAN_CHARS < len(text) < MAX_CLEAN_CHARS:
+        return True
+    return any(marker in text for marker in SUSPICIOUS_MARKERS)
+
+
 def execute(ru_post_text: str) -> str:
     """
     Quality check and polish Russian translation.
@@ -57,14 +86,19 @@ def execute(ru_post_text: str) -> str:
     Returns:
         Polished Russian text, or original on failure
     """
+    if not _needs_review(ru_post_text):
+        log_info("[Reviewer] Translation looks clean, skipping review")
+        return ru_post_text
+
     try:
         result = chat_completion(
-            prompt=PROMPT.format(post_text=ru_post_text),
+            prompt=PROMPT_PREFIX + ru_post_text,
             system_message=SYSTEM_MESSAGE,
             model=MODEL,
             temperature=TEMPERATURE,
-            max_tokens=MAX_TOKENS,
-            json_mode=True,
+            max_tokens=_max_tokens(ru_post_text),
+            json_schema=POST_SCHEMA,
+            stream=True,  # Return as soon as the JSON object is complete
         )
 
         polished = result.get("post_text", "")
@@ -75,6 +109,10 @@ def execute(ru_post_text: str) -> str:
         log_info(f"[Reviewer] ✓ Polished ({len(polished)} chars)")
         return polished
 
+    except TruncatedResponseError as e:
+        log_error(f"[Reviewer] Output truncated, using original: {e}")
+        return ru_post_text  # The unreviewed translation is still a complete post
+
     except Exception as e:
         log_error(f"[Reviewer] Error (using original): {e}")
         send_error(str(e), node_name="translation_reviewer")
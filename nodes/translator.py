@@ -9,9 +9,18 @@ OUTPUT: RU post text (HTML) or None on failure
 # ── AI Configuration ─────────────────────────────────────────
 MODEL = "anthropic/claude-sonnet-4.5"
 TEMPERATURE = 0.7
-MAX_TOKENS = 1500
+MAX_TOKENS = 800  # Floor; posts are <= ~700 chars, Cyrillic + HTML tags run ~2-3 chars per token
+TOKEN_HEADROOM = 400  # JSON wrapper + any reasoning tokens the model spends first
 
-PROMPT = "Post text: {post_text}"
+PROMPT_PREFIX = "Post text: "  # Prompt is PROMPT_PREFIX + post text
+
+# Strict structured output: exactly {"post_text": "..."}, nothing around it
+POST_SCHEMA = {
+    "type": "object",
+    "properties": {"post_text": {"type": "string"}},
+    "required": ["post_text"],
+    "additionalProperties": False,
+}
 
 SYSTEM_MESSAGE = """You are an expert Telegram post writer for Russian audiences. You will receive an English post and your job is to WRITE it in natural Russian, not translate it directly.
 
@@ -61,11 +70,19 @@ Return only a valid JSON object with no explanations, no comments, no additional
 Remember: Your task is to WRITE in Russian, not translate into Russian. The result should read as if it was originally composed by a native Russian speaker for a Russian Telegram audience."""
 
 # ── Implementation ────────────────────────────────────────────
-from utils.openrouter_client import chat_completion
+from utils.openrouter_client import chat_completion, TruncatedResponseError
 from utils.logger import log_info, log_error
 from utils.telegram_error import send_error
 
 
+def _max_tokens(post_text: str) -> int:
+    """
+    Output cap sized from the input: one token per input character is ~2x the
+    Russian output's tokens, so a long post is not cut off inside the JSON.
+    """
+    return max(MAX_TOKENS, len(post_text) + TOKEN_HEADROOM)
+
+
 def execute(en_post_text: str) -> str | None:
     """
     Rewrite English post in natural Russian.
@@ -78,12 +95,13 @@ def execute(en_post_text: str) -> str | None:
     """
     try:
         result = chat_completion(
-            prompt=PROMPT.format(post_text=en_post_text),
+            prompt=PROMPT_PREFIX + en_post_text,
             system_message=SYSTEM_MESSAGE,
             model=MODEL,
             temperature=TEMPERATURE,
-            max_tokens=MAX_TOKENS,
-            json_mode=True,
+            max_tokens=_max_tokens(en_post_text),
+            json_schema=POST_SCHEMA,
+            stream=True,  # Return as soon as the JSON object is complete
         )
 
         ru_text = result.get("post_text", "")
@@ -94,6 +112,11 @@ def execute(en_post_text: str) -> str | None:
         log_info(f"[Translator] ✓ {len(ru_text)} chars")
         return ru_text
 
+    except TruncatedResponseError as e:
+        # Not worth an admin alert: the RU post is skipped, the EN post is already out
+        log_error(f"[Translator] Output truncated, skipping RU post: {e}")
+        return None
+
     except Exception as e:
         log_error(f"[Translator] Error: {e}")
         send_error(str(e), node_name="translator")
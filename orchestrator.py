@@ -0,0 +1,399 @@
+"""
+AI Flow Daily — Main Orchestrator
+==================================
+Started by main.py (run `python main.py`, not this module: the image workers
+re-import whatever file was run as __main__).
+
+Runs two parallel components:
+  1. APScheduler: triggers article pipeline every 10 min
+  2. Telegram Bot: listens for admin approval callbacks
+
+Pipeline per article:
+  fetch → summarize → relevance → dedup (one batched call per run) → write → fix_html
+  → find_creative → save_to_notion → admin_preview
+  → [on approve] post_to_main → update_notion → translate → post_to_ru
+  → [on decline] update_notion
+"""
+
+import asyncio
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+
+from telegram import Update
+from telegram.ext import Application, CallbackQueryHandler, ContextTypes
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+from utils.config import (
+    TELEGRAM_BOT_TOKEN, POLL_INTERVAL_MINUTES, MAX_CONCURRENT_ARTICLES, WORKER_THREADS,
+    WEBHOOK_URL, WEBHOOK_PORT, WEBHOOK_PATH, WEBHOOK_SECRET,
+)
+from utils.logger import log_info, log_error, get_logger, log_section
+from utils.telegram_error import send_error
+from utils import notion_client, http_async, img
+
+# Node imports
+from nodes import fetch_rss, fetch_websites
+from nodes import summarizer, relevance_checker, duplicate_control
+from nodes import post_writer, fix_html, find_creative
+from nodes import save_to_notion, post_to_telegram
+from nodes import translator, translation_reviewer, post_to_ru
+
+
+# ── Pipeline ─────────────────────────────────────────────────
+
+# Caps how many articles go through the pipeline at once (OpenRouter/Notion rate limits)
+ARTICLE_SEMAPHORE = asyncio.Semaphore(MAX_CONCURRENT_ARTICLES)
+
+
+async def screen_article(article: dict) -> dict | None:
+    """Run the per-article filters (summarizer → relevance) for a single article.
+
+    All synchronous node calls (OpenRouter, Notion, HTTP) are wrapped in
+    asyncio.to_thread() so they run in background threads and never block
+    the Telegram polling loop. This keeps buttons responsive at all times.
+
+    Returns the summarized article, or None if it was filtered out.
+    """
+
+    async with ARTICLE_SEMAPHORE:
+        source = article.get("source", "unknown")
+        url = article.get("article_url", "unknown")
+        log_section(f"Processing [{source}]: {url}")
+
+        # 1. Summarize (sync OpenRouter call → thread)
+        article = await asyncio.to_thread(summarizer.execute, article)
+        if not article:
+            log_info(f"  ↳ Skipped by Summarizer: {url}")
+            return None
+
+        # 2. Relevance check (sync OpenRouter call → thread)
+        article = await asyncio.to_thread(relevance_checker.execute, article)
+        if not article:
+            log_info(f"  ↳ Skipped by Relevance Checker: {url}")
+            return None
+
+        return article
+
+
+async def _write_post(article: dict) -> str | None:
+    """Write the post and clean its HTML. Returns None if the writer produced nothing."""
+    # 4. Write post (sync OpenRouter call → thread)
+    post_text = await asyncio.to_thread(post_writer.execute, article)
+    if not post_text:
+        return None
+
+    # 5. Fix HTML + add signature (fast, but thread for safety)
+    return await asyncio.to_thread(fix_html.execute, post_text)
+
+
+async def process_article(article: dict, bot) -> None:
+    """Write, illustrate and send a screened, non-duplicate article for approval.
+
+    At most MAX_CONCURRENT_ARTICLES articles run at once (see ARTICLE_SEMAPHORE).
+    """
+
+    async with ARTICLE_SEMAPHORE:
+        # 4-6. Write post and find creative concurrently — the creative only
+        # depends on the article, not on the post text
+        post_text, creative = await asyncio.gather(
+            _write_post(article),
+            asyncio.to_thread(find_creative.execute, article),  # sync HTTP call → thread
+        )
+        if not post_text:
+            log_info(f"  ↳ Skipped by Post Writer (empty output): {article.get('article_url')}")
+            return
+
+        # 7. Build article data for approval flow
+        article_data = {
+            "post_text": post_text,
+            "creative_type": creative["creative_type"],
+            "creative_url": creative["creative_url"],
+            "article_title": article.get("article_title", ""),
+            "article_url": article.get("article_url", ""),
+            "relevance_reason": article.get("relevance_reason", ""),
+        }
+
+        # 8. Save to Notion (sync Notion call → thread)
+        page_id = await asyncio.to_thread(
+            save_to_notion.create_row,
+            title=article.get("article_title", ""),
+            article_url=article.get("article_url", ""),
+            creative_url=creative["creative_url"],
+            post_text=post_text,
+            why_relevant=article.get("relevance_reason", ""),
+        )
+        article_data["notion_page_id"] = page_id
+
+        # 9. Send preview to admin channel (already async)
+        callback_id = await post_to_telegram.send_preview(bot, article_data)
+        if not callback_id:
+            log_error("  ↳ Failed to send admin preview")
+            return
+
+        log_info(f"  ↳ Awaiting approval (callback:{callback_id})")
+
+
+async def _gather_articles(coro_fn, articles: list[dict]) -> list:
+    """Run coro_fn over all articles concurrently; report failures and map them to None."""
+    results = await asyncio.gather(
+        *(coro_fn(article) for article in articles),
+        return_exceptions=True,
+    )
+    for i, (article, result) in enumerate(zip(articles, results)):
+        if isinstance(result, Exception):
+            log_error(f"Error processing article {article.get('article_url')}: {result}")
+            send_error(str(result), node_name="main_pipeline")
+            results[i] = None
+    return results
+
+
+async def run_pipeline(bot) -> None:
+    """Fetch all sources and process new articles."""
+    log_section("Pipeline started")
+
+    try:
+        # Fetch from all sources concurrently (sync HTTP/RSS calls → threads).
+        # URL dedup uses the cached Notion URL set (utils/notion_cache).
+        rss_articles, web_articles = await asyncio.gather(
+            asyncio.to_thread(fetch_rss.execute),
+            asyncio.to_thread(fetch_websites.execute),
+        )
+
+        # Same article can show up in an RSS feed and on a list page
+        unique = {}
+        for article in rss_articles + web_articles:
+            unique.setdefault(article["article_url"], article)
+        articles = list(unique.values())
+
+        if not articles:
+            log_info("No new articles found")
+            log_section("Pipeline finished")
+            return
+
+        log_info(f"Found {len(articles)} new article(s) to process")
+
+        # 1-2. Summarize + relevance, articles concurrently (bounded by ARTICLE_SEMAPHORE)
+        screened = [a for a in await _gather_articles(screen_article, articles) if a]
+        if not screened:
+            log_section("Pipeline finished")
+            return
+
+        # 3. Duplicate control: one LLM call for the whole batch (sync → thread)
+        verdicts = await asyncio.to_thread(duplicate_control.execute_batch, screened)
+        unique_articles = [a for a in verdicts if a]
+        log_info(f"  ↳ {len(screened) - len(unique_articles)} article(s) skipped by Duplicate Control")
+
+        # 4-9. Write → creative → Notion → admin preview, articles concurrently
+        await _gather_articles(lambda a: process_article(a, bot), unique_articles)
+
+    except Exception as e:
+        log_error(f"Pipeline error: {e}")
+        send_error(str(e), node_name="main_pipeline")
+
+    log_section("Pipeline finished")
+
+
+# ── Approval Callback Handler ────────────────────────────────
+
+VIDEO_EXTS = frozenset({".mp4", ".mov", ".webm"})
+
+# Page IDs whose approve/decline is currently being processed
+_approvals_in_flight: set[str] = set()
+
+
+def _infer_creative_type(creative_url: str) -> str:
+    """Guess "video"|"image"|"none" from the creative URL's file extension."""
+    if not creative_url or creative_url == "none":
+        return "none"
+    ext = posixpath.splitext(urlparse(creative_url).path)[1].lower()
+    return "video" if ext in VIDEO_EXTS else "image"
+
+
+async def handle_approval(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle Approve/Decline button presses from admin channel.
+
+    Only acknowledges the callback here; the Notion + Telegram work runs as a
+    background task so the ACK never waits on slow calls and other updates
+    keep flowing.
+    """
+    query = update.callback_query
+    await query.answer()  # Acknowledge immediately
+
+    data = query.data  # "approve:UUID" or "decline:UUID"
+    parts = data.split(":", 1)
+    if len(parts) != 2:
+        return
+
+    action, page_id = parts
+
+    # A double click must not post twice while the first click is still running
+    if page_id in _approvals_in_flight:
+        log_info(f"Ignoring repeated {action} for {page_id} (already in progress)")
+        return
+    _approvals_in_flight.add(page_id)
+
+    context.application.create_task(_process_approval(query, context.bot, action, page_id))
+
+
+async def _process_approval(query, bot, action: str, page_id: str) -> None:
+    """Post or decline an article after its button was pressed."""
+    try:
+        # 1. Try the pending store first. Claimed (popped) before anything is sent:
+        #    if the process dies mid-post, the next click falls back to Notion and
+        #    its status check instead of posting the same entry again.
+        article_data = post_to_telegram.pending_posts.pop(page_id, None)
+
+        # 2. Fallback: Fetch from Notion if not in memory (stateless)
+        if not article_data:
+            log_info(f"Callback data not in memory, fetching Notion page: {page_id}")
+            article_data = await asyncio.to_thread(notion_client.get_article_data, page_id)
+
+            if not article_data:
+                await query.edit_message_text(f"⚠️ Error: Post data not found in Notion ({page_id})")
+                return
+
+            # Infer creative type since we don't store it explicitly in Notion properties
+            article_data["creative_type"] = _infer_creative_type(article_data.get("creative_url", ""))
+            
+            # Check status to prevent double-posting
+            status = article_data.get("status")
+            if status == "Posted":
+                await query.edit_message_text(f"✅ Already Posted: {article_data.get('title')}")
+                return
+            elif status == "Declined":
+                await query.edit_message_text(f"❌ Already Declined: {article_data.get('title')}")
+                return
+
+        # 3. Handle Actions
+        title_to_show = article_data.get("article_title", article_data.get("title", "Unknown"))
+        if action == "approve":
+            log_info(f"Processing approval for {page_id}")
+            
+            result = await post_to_telegram.post_to_main_channel(bot, article_data)
+
+            if result:
+                # Update Notion: Posted
+                await asyncio.to_thread(save_to_notion.mark_posted, page_id, result["post_url"])
+
+                # Edit admin message
+                await query.edit_message_text(f"✅ Approved & Posted: {title_to_show}")
+
+                # Trigger RU translation workflow
+                asyncio.create_task(_run_ru_pipeline(bot, article_data))
+
+            else:
+                # Nothing was posted: put the entry back so a retry click uses it
+                post_to_telegram.pending_posts.put(page_id, article_data)
+                await query.edit_message_text(f"⚠️ Error posting to main channel.")
+
+        elif action == "decline":
+            log_info(f"Declining post {page_id}")
+            
+            # Update Notion: Declined
+            await asyncio.to_thread(save_to_notion.mark_declined, page_id)
+
+            await query.edit_message_text(f"❌ Declined: {title_to_show}")
+
+    except Exception as e:
+        log_error(f"[Approval] Unhandled error: {e}")
+        send_error(f"Approval handler crashed: {e}", node_name="handle_approval")
+        try:
+            await query.edit_message_text(f"⚠️ Error processing action: {str(e)[:200]}")
+        except Exception:
+            pass
+    finally:
+        _approvals_in_flight.discard(page_id)
+
+
+async def _run_ru_pipeline(bot, article_data: dict) -> None:
+    """Run the Russian translation and posting pipeline."""
+    try:
+        en_text = article_data["post_text"]
+
+        # 1. Translate to Russian (sync call → run in thread)
+        ru_text = await asyncio.to_thread(translator.execute, en_text)
+        if not ru_text:
+            log_error("[RU Pipeline] Translation failed, skipping RU post")
+            return
+
+        # 2. Quality review (sync call → run in thread)
+        ru_text = await asyncio.to_thread(translation_reviewer.execute, ru_text)
+
+        # 3. Post to Russian channel
+        await post_to_ru.execute(
+            bot=bot,
+            ru_post_text=ru_text,
+            creative_type=article_data.get("creative_type", "none"),
+            creative_url=article_data.get("creative_url", "none"),
+        )
+
+    except Exception as e:
+        log_error(f"[RU Pipeline] Error: {e}")
+        send_error(str(e), node_name="ru_pipeline")
+
+
+# ── Main Entry Point ─────────────────────────────────────────
+
+
+def main():
+    """Start the bot and scheduler."""
+    log_info("🚀 AI Flow Daily starting...")
+
+    # Build Telegram application
+    app = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+
+    # Register callback handler for approval buttons
+    app.add_handler(CallbackQueryHandler(handle_approval))
+
+    # Set up scheduler
+    scheduler = AsyncIOScheduler()
+
+    async def scheduled_job():
+        """Run pipeline using the bot's instance."""
+        await run_pipeline(app.bot)
+
+    scheduler.add_job(
+        scheduled_job,
+        "interval",
+        minutes=POLL_INTERVAL_MINUTES,
+        next_run_time=datetime.now(timezone.utc),  # Run immediately on start
+        id="article_pipeline",
+        name="Article Pipeline",
+    )
+
+    # Start scheduler when app starts
+    async def post_init(application: Application):
+        # Every sync node runs via asyncio.to_thread(). The default pool is only
+        # min(32, cpu+4) threads — 5-6 on a small container — which would cap
+        # concurrent articles well below MAX_CONCURRENT_ARTICLES.
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=WORKER_THREADS, thread_name_prefix="node")
+        )
+        scheduler.start()
+        log_info(f"⏰ Scheduler started (every {POLL_INTERVAL_MINUTES} min)")
+
+    async def post_shutdown(application: Application):
+        await http_async.close_session()
+        img.shutdown()
+
+    app.post_init = post_init
+    app.post_shutdown = post_shutdown
+
+    # Run bot (blocks forever). Webhook when a public URL is configured —
+    # updates are pushed instantly — otherwise long polling.
+    log_info("🤖 Bot is listening for approvals...")
+    if WEBHOOK_URL:
+        app.run_webhook(
+            listen="0.0.0.0",
+            port=WEBHOOK_PORT,
+            url_path=WEBHOOK_PATH,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{WEBHOOK_PATH}",
+            secret_token=WEBHOOK_SECRET or None,
+            allowed_updates=[Update.CALLBACK_QUERY],
+        )
+    else:
+        app.run_polling(allowed_updates=[Update.CALLBACK_QUERY])
+
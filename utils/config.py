@@ -18,16 +18,27 @@ def _require(key: str) -> str:
     return val
 
 
+# ── Local state ─────────────────────────────────────────────
+# pending_posts.db, llm_cache.db, rss_state.json. Docker mounts this as a volume.
+DATA_DIR = os.getenv("DATA_DIR") or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.makedirs(DATA_DIR, exist_ok=True)
+
 # ── Telegram ────────────────────────────────────────────────
 TELEGRAM_BOT_TOKEN = _require("TELEGRAM_BOT_TOKEN")
 ADMIN_CHANNEL_ID = _require("ADMIN_CHANNEL_ID")
 ADMIN_USER_ID = os.getenv("ADMIN_USER_ID", ADMIN_CHANNEL_ID)  # Fallback to channel if not set
 MAIN_CHANNEL_ID = os.getenv("MAIN_CHANNEL_ID", "@aiflowdaily")
 RU_CHANNEL_ID = os.getenv("RU_CHANNEL_ID", "@aiflowdaily_ru")
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")  # Public base URL; empty = long polling
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8443"))
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "telegram")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")  # Checked against X-Telegram-Bot-Api-Secret-Token
 
 # ── AI Models (all via OpenRouter) ──────────────────────────
 OPENROUTER_API_KEY = _require("OPENROUTER_API_KEY")
 OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
+OPENROUTER_MAX_CONCURRENCY = int(os.getenv("OPENROUTER_MAX_CONCURRENCY", "8"))  # LLM requests in flight
+OPENROUTER_RPM = int(os.getenv("OPENROUTER_RPM", "60"))  # Requests per minute, client-side
 
 # ── Notion ──────────────────────────────────────────────────
 NOTION_TOKEN = _require("NOTION_TOKEN")
@@ -42,6 +53,14 @@ TAVILY_API_KEY = os.getenv("TAVILY_API_KEY", "")
 
 # ── Scheduling ──────────────────────────────────────────────
 POLL_INTERVAL_MINUTES = int(os.getenv("POLL_INTERVAL_MINUTES", "10"))
+MAX_CONCURRENT_ARTICLES = int(os.getenv("MAX_CONCURRENT_ARTICLES", "5"))  # Bounded by OpenRouter/Notion limits
+WORKER_THREADS = int(os.getenv("WORKER_THREADS", "32"))  # Thread pool behind asyncio.to_thread()
+
+# ── Article limits ──────────────────────────────────────────
+MAX_INPUT_TOKENS = 2000  # Summarizer's article budget — the one input limit (estimated, see nodes/summarizer)
+# Raw text kept after fetching: the most the token budget can ever keep (ASCII, ~4 chars
+# per token), so this cut never removes text the summarizer would have read
+MAX_ARTICLE_CHARS = MAX_INPUT_TOKENS * 4
 
 # ── RSS Feed URLs ───────────────────────────────────────────
 RSS_FEEDS = {
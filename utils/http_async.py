@@ -0,0 +1,101 @@
+"""
+UTIL: Async HTTP Session
+PURPOSE: Shared aiohttp.ClientSession for downloads made from async code (Telegram
+         image posts), so they never block the event loop and reuse pooled
+         connections and cached DNS between calls. Created lazily on first use
+         (it must be bound to the running loop) and closed on bot shutdown.
+         Also downloads + resizes post covers once per URL: the admin preview,
+         the main channel post and the RU post all reuse the same JPEG bytes.
+DEPENDENCIES: aiohttp, cachetools
+"""
+
+from io import BytesIO
+
+import aiohttp
+from cachetools import LRUCache
+
+from utils import img
+from utils.img import MAX_IMAGE_SIZE
+from utils.logger import log_error
+
+CHUNK_SIZE = 64 * 1024
+
+# Browser-like headers: several image CDNs reject default client user agents
+IMAGE_HEADERS = {
+    "Accept": "*/*",
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+}
+
+# (url, max_size, verified) -> resized JPEG bytes. `verified` keeps bytes fetched without a
+# certificate check away from callers that require one. Only touched from the event loop.
+_resized_cache = LRUCache(maxsize=64)
+
+_session: aiohttp.ClientSession | None = None
+
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the shared session, creating it on first use (call from the event loop)."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _session
+
+
+async def fetch_buffer(url: str, headers: dict | None = None, ssl: bool = True) -> BytesIO:
+    """
+    Download a URL into a BytesIO, chunk by chunk. Raises on network errors and HTTP 4xx/5xx.
+    Streaming into the buffer avoids holding the chunk list and the joined body
+    (two full-size copies) at once, as resp.read() does.
+
+    Args:
+        ssl: False disables certificate verification (some image CDNs serve broken chains)
+    """
+    buffer = BytesIO()
+    async with get_session().get(url, headers=headers, ssl=ssl) as resp:
+        resp.raise_for_status()
+        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+            buffer.write(chunk)
+    buffer.seek(0)
+    return buffer
+
+
+async def fetch_resized(url: str, max_size: int = MAX_IMAGE_SIZE, insecure_fallback: bool = False) -> bytes:
+    """
+    Download an image and resize it (in the image process pool), cached per URL and size.
+    Raises on download/decode errors; failures are not cached.
+
+    Args:
+        insecure_fallback: On a certificate error, retry without verification
+                           (admin preview only: some image CDNs serve broken chains)
+    """
+    verified_key = (url, max_size, True)
+    cached = _resized_cache.get(verified_key)
+    if cached is None and insecure_fallback:
+        cached = _resized_cache.get((url, max_size, False))
+    if cached is not None:
+        return cached
+
+    try:
+        source = await fetch_buffer(url, headers=IMAGE_HEADERS)
+        key = verified_key
+    except aiohttp.ClientSSLError as e:
+        if not insecure_fallback:
+            raise
+        log_error(f"[Image] Certificate error for {url}, retrying unverified: {e}")
+        source = await fetch_buffer(url, headers=IMAGE_HEADERS, ssl=False)
+        key = (url, max_size, False)
+
+    data = await img.resize_bytes(source.getvalue(), max_size)
+    _resized_cache[key] = data
+    return data
+
+
+async def close_session() -> None:
+    """Close the shared session (called from the Application's post_shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
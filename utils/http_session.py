@@ -0,0 +1,45 @@
+"""
+UTIL: HTTP Session
+PURPOSE: Shared pooled requests.Session for the parser microservice, Tavily and the
+         image-finder microservice.
+         Keeps TCP+TLS connections alive between calls, requests compressed
+         responses, and retries transient gateway errors (502/503/504) with backoff.
+DEPENDENCIES: requests, brotli
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connect timeout for every call: a dead host fails in seconds, while the read
+# timeout (per call site) stays long enough for slow parser jobs.
+CONNECT_TIMEOUT = 10
+
+_RETRY = Retry(
+    total=3,
+    connect=3,
+    read=0,  # Never re-send after a read timeout — parser calls take up to 2 minutes
+    status=3,
+    backoff_factor=0.5,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=frozenset({"GET", "POST"}),  # Parser/Tavily/image-finder POSTs are idempotent
+    raise_on_status=False,  # Hand the last response back so raise_for_status() reports it
+)
+
+
+def _build_session() -> requests.Session:
+    """Create a Session with a connection-pooling, retrying adapter."""
+    session = requests.Session()
+    # Parser responses carry full article text — ask for compression. urllib3
+    # decodes "br" transparently when the brotli package is installed.
+    session.headers.update({
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+    })
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=_RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = _build_session()
@@ -0,0 +1,69 @@
+"""
+UTIL: Image Processing
+PURPOSE: CPU-bound cover resizing (decode → downscale → JPEG) in a small process
+         pool, so resizes of concurrent posts run on separate cores instead of
+         contending for the GIL in the bot process. The pool starts lazily on
+         first use and is shut down with the bot.
+DEPENDENCIES: Pillow
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from PIL import Image
+
+MAX_IMAGE_SIZE = 2000  # Longest side of resized covers, px (matching n8n Resize node)
+JPEG_QUALITY = 85
+MAX_WORKERS = min(4, os.cpu_count() or 1)  # Covers arrive a few at a time; keep memory bounded
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _sync_resize(data: bytes, max_size: int) -> bytes:
+    """Decode and resize an image to max dimensions, re-encoded as JPEG. Runs in a worker process."""
+    with Image.open(BytesIO(data)) as img:
+        # JPEG only (no-op otherwise): let libjpeg decode at 1/2, 1/4 or 1/8 scale,
+        # still >= max_size, instead of decoding every pixel of a 4K photo
+        img.draft("RGB", (max_size, max_size))
+        img.thumbnail((max_size, max_size), Image.LANCZOS)
+
+        # JPEG is a fraction of the PNG size for photographic covers (Telegram
+        # re-encodes photos anyway); JPEG has no alpha/palette, so flatten first —
+        # transparent areas onto white (a plain convert would turn them black)
+        if img.has_transparency_data:
+            rgba = img.convert("RGBA")
+            img = Image.new("RGB", rgba.size, (255, 255, 255))
+            img.paste(rgba, mask=rgba.getchannel("A"))
+        elif img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+
+        output = BytesIO()
+        img.save(output, format="JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True)
+    return output.getvalue()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the pool on first use. forkserver: never fork the threaded bot process."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=MAX_WORKERS,
+            mp_context=multiprocessing.get_context("forkserver"),
+        )
+    return _pool
+
+
+async def resize_bytes(data: bytes, max_size: int = MAX_IMAGE_SIZE) -> bytes:
+    """Resize image bytes to at most max_size px (JPEG) in the process pool."""
+    return await asyncio.get_running_loop().run_in_executor(_get_pool(), _sync_resize, data, max_size)
+
+
+def shutdown() -> None:
+    """Stop the worker processes (called from the Application's post_shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
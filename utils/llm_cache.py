@@ -0,0 +1,65 @@
+"""
+UTIL: LLM Cache
+PURPOSE: Content-addressed cache of LLM outputs in SQLite, so re-running the same
+         article (retries, manual re-runs, restarts) reuses the earlier answer
+         instead of paying for another LLM round trip. Keys are blake2b digests
+         of everything that determines the output (model, temperature, prompts).
+DEPENDENCIES: sqlite3, hashlib (stdlib)
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+
+from utils.config import DATA_DIR
+from utils.logger import log_debug
+
+CACHE_DB = os.path.join(DATA_DIR, "llm_cache.db")
+CACHE_TTL = 7 * 86400  # Seconds; articles are never re-run after a week
+
+
+def make_key(*parts) -> bytes:
+    """Digest of the call inputs (each part is str()-ed; order matters)."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(str(part).encode())
+        h.update(b"\x00")  # Separator, so ("ab", "c") != ("a", "bc")
+    return h.digest()
+
+
+class LLMCache:
+    """get/put of text values by key, expiring after `ttl` seconds. Thread-safe."""
+
+    def __init__(self, path: str, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, value TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM cache WHERE ts < ?", (time.time() - ttl,))
+        if cur.rowcount:
+            log_debug(f"[LLM Cache] Purged {cur.rowcount} expired entries")
+
+    def get(self, key: bytes) -> str | None:
+        """Cached value, or None if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM cache WHERE key = ? AND ts >= ?", (key, time.time() - self.ttl)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: bytes, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+
+
+CACHE = LLMCache(CACHE_DB, CACHE_TTL)
@@ -1,31 +1,45 @@
 """
 UTIL: Logger
 PURPOSE: Structured logging with timestamps. Logs to console (colorized) + file (automation.log).
+         File writes happen on a background QueueListener thread, so callers only
+         enqueue the record instead of blocking on disk I/O.
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
-import colorlog
+from logging.handlers import QueueHandler, QueueListener
 
 LOG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 LOG_FILE = os.path.join(LOG_DIR, "automation.log")
 
 # ── Formatter ────────────────────────────────────────────────
 FILE_FORMAT = "%(asctime)s | %(levelname)-8s | %(message)s"
-# Console: Gray time | Colorized Level | Message
-CONSOLE_FORMAT = "%(log_color)s%(asctime)s | %(message)s"
+# Console: Time | Message, whole line colored by level
+CONSOLE_FORMAT = "%(asctime)s | %(message)s"
 
 DATE_FORMAT_FILE = "%Y-%m-%d %H:%M:%S"
 DATE_FORMAT_CONSOLE = "%H:%M:%S"
 
+# ANSI prefixes by level number
 COLORS = {
-    'DEBUG':    'cyan',
-    'INFO':     'green',
-    'WARNING':  'yellow',
-    'ERROR':    'red',
-    'CRITICAL': 'red,bg_white',
+    logging.DEBUG:    "\x1b[36m",     # cyan
+    logging.INFO:     "\x1b[32m",     # green
+    logging.WARNING:  "\x1b[33m",     # yellow
+    logging.ERROR:    "\x1b[31m",     # red
+    logging.CRITICAL: "\x1b[31;47m",  # red on white
 }
+RESET = "\x1b[0m"
+
+
+class ColorFormatter(logging.Formatter):
+    """Standard formatting wrapped in the level's ANSI color (one dict lookup per record)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"{COLORS.get(record.levelno, '')}{super().format(record)}{RESET}"
+
 
 def get_logger(name: str = "ai_flow") -> logging.Logger:
     """Return a configured logger instance."""
@@ -40,20 +54,22 @@ def get_logger(name: str = "ai_flow") -> logging.Logger:
     console = logging.StreamHandler(sys.stdout)
     console.setLevel(logging.INFO)
     
-    formatter = colorlog.ColoredFormatter(
-        CONSOLE_FORMAT,
-        datefmt=DATE_FORMAT_CONSOLE,
-        log_colors=COLORS,
-        reset=True,
-    )
-    console.setFormatter(formatter)
+    console.setFormatter(ColorFormatter(CONSOLE_FORMAT, datefmt=DATE_FORMAT_CONSOLE))
     logger.addHandler(console)
 
-    # File handler (DEBUG+) - full detail
+    # File handler (DEBUG+) - full detail, owned by the listener thread
     file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(FILE_FORMAT, datefmt=DATE_FORMAT_FILE))
-    logger.addHandler(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(logging.DEBUG)
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on exit
 
     return logger
 
@@ -0,0 +1,60 @@
+"""
+UTIL: Notion URL Cache
+PURPOSE: In-process set of Source URLs already in the Notion database, for URL dedup
+         in the fetch nodes. Loaded with one paginated query and refreshed every
+         few minutes, so URLs seen recently are a set lookup instead of a Notion
+         request. The snapshot only covers the last KNOWN_URL_DAYS, so a miss is
+         always confirmed with notion_client.url_exists() (an older page would
+         otherwise count as new); misses are the rare, genuinely-new candidates.
+DEPENDENCIES: notion-client (via utils/notion_client)
+"""
+
+import threading
+import time
+
+from utils import notion_client
+from utils.logger import log_debug
+
+REFRESH_SECONDS = 300
+KNOWN_URL_DAYS = 30  # Feeds and list pages only surface recent articles
+
+_seen_urls: set[str] | None = None
+_loaded_at = 0.0
+_lock = threading.Lock()
+
+
+def _refresh_if_stale() -> None:
+    """Reload the URL set if it is older than REFRESH_SECONDS (call with _lock held)."""
+    global _seen_urls, _loaded_at
+    if _seen_urls is not None and time.monotonic() - _loaded_at < REFRESH_SECONDS:
+        return
+
+    urls = notion_client.get_known_urls(days=KNOWN_URL_DAYS)
+    _loaded_at = time.monotonic()
+    if urls is None:
+        if _seen_urls is None:
+            _seen_urls = set()
+        return  # Keep the previous snapshot; misses are confirmed with Notion anyway
+
+    _seen_urls = urls
+    log_debug(f"[Notion cache] {len(urls)} known URL(s) loaded")
+
+
+def is_known(url: str) -> bool:
+    """True if the URL is already in Notion."""
+    with _lock:
+        _refresh_if_stale()
+        if url in _seen_urls:
+            return True
+
+    if notion_client.url_exists(url):
+        add(url)  # Older than the snapshot window: remember it until the next refresh
+        return True
+    return False
+
+
+def add(url: str) -> None:
+    """Record a URL that was just saved to Notion (visible before the next refresh)."""
+    with _lock:
+        if _seen_urls is not None:
+            _seen_urls.add(url)
@@ -2,16 +2,63 @@
 UTIL: Notion Client
 PURPOSE: Wrapper around Notion API for article tracking.
          Handles querying, creating, and updating database pages.
-DEPENDENCIES: notion-client
+DEPENDENCIES: notion-client, cachetools
 """
 
+import random
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from cachetools import TTLCache
 from notion_client import Client
+from notion_client.errors import HTTPResponseError
 from utils.config import NOTION_TOKEN, NOTION_DATABASE_ID
 from utils.logger import log_info, log_error, log_debug
+from utils.rate_limiter import RateLimiter
 
 notion = Client(auth=NOTION_TOKEN)
 
+# Notion allows ~3 requests/second per integration. Every call below goes
+# through _call(), which shares this limiter across all pipeline threads.
+_NOTION_LIMITER = RateLimiter(3, 1.0)
+MAX_RETRIES = 5
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# get_recent_articles() results keyed by `days`. Shared by all articles in a
+# pipeline run; cleared whenever a new page is created so dedup never goes stale.
+_recent_cache = TTLCache(maxsize=8, ttl=300)
+RECENT_POST_CHARS = 200
+_recent_lock = threading.Lock()
+
+# get_article_data() results keyed by page ID, for repeated approval-button
+# lookups of the same page. Dropped whenever update_page_status() touches the page.
+_page_cache = TTLCache(maxsize=512, ttl=60)
+_page_lock = threading.Lock()
+
+
+# ── Rate-limited request wrapper ─────────────────────────────
+
+
+def _call(method, **kwargs):
+    """
+    Run a Notion SDK method through the shared rate limiter.
+    Retries 429/5xx with exponential backoff + jitter, honoring Retry-After.
+    """
+    for attempt in range(1, MAX_RETRIES + 1):
+        _NOTION_LIMITER.acquire()
+        try:
+            return method(**kwargs)
+        except HTTPResponseError as e:
+            if e.status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
+                raise
+            retry_after = e.headers.get("Retry-After")
+            try:
+                delay = float(retry_after)
+            except (TypeError, ValueError):
+                delay = min(32, 2 ** (attempt - 1)) + random.random()
+            log_debug(f"Notion HTTP {e.status}, retrying in {delay:.1f}s (attempt {attempt})")
+            time.sleep(delay)
+
 
 # ── Query helpers ────────────────────────────────────────────
 
@@ -19,7 +66,8 @@ notion = Client(auth=NOTION_TOKEN)
 def url_exists(article_url: str) -> bool:
     """Check if an article URL already exists in the database."""
     try:
-        result = notion.databases.query(
+        result = _call(
+            notion.databases.query,
             database_id=NOTION_DATABASE_ID,
             filter={
                 "property": "Source URL",
@@ -32,32 +80,95 @@ def url_exists(article_url: str) -> bool:
         return False
 
 
+def get_known_urls(days: int = 30) -> set[str] | None:
+    """
+    Get the Source URLs of all pages edited in the last `days` days.
+    One paginated query replaces a url_exists() call per candidate (see utils/notion_cache).
+    Returns None on failure (a partial set would let duplicates through).
+    """
+    cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+    urls = set()
+
+    try:
+        cursor = None
+        while True:
+            kwargs = {
+                "database_id": NOTION_DATABASE_ID,
+                "filter": {
+                    "timestamp": "last_edited_time",
+                    "last_edited_time": {"on_or_after": cutoff},
+                },
+                "page_size": 100,
+            }
+            if cursor:
+                kwargs["start_cursor"] = cursor
+
+            result = _call(notion.databases.query, **kwargs)
+            for page in result.get("results", []):
+                url = page.get("properties", {}).get("Source URL", {}).get("url")
+                if url:
+                    urls.add(url)
+
+            if not result.get("has_more"):
+                break
+            cursor = result.get("next_cursor")
+
+        log_debug(f"Loaded {len(urls)} known URL(s) from Notion (last {days} days)")
+        return urls
+    except Exception as e:
+        log_error(f"Notion get_known_urls failed: {e}")
+        return None
+
+
 def get_recent_articles(days: int = 3) -> list[dict]:
     """
     Get recent articles from the database (for duplicate checking).
-    Returns list of {title, source_url, post_text} dicts.
+    Returns list of {title, source_url, post_text} dicts, post_text cut to
+    RECENT_POST_CHARS (dedup only compares the opening of each post).
+    Cached for 5 minutes (see _recent_cache); callers get their own copy of the list.
     """
+    with _recent_lock:
+        cached = _recent_cache.get(days)
+    if cached is not None:
+        return [dict(a) for a in cached]
+
     cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
 
     try:
-        result = notion.databases.query(
-            database_id=NOTION_DATABASE_ID,
-            filter={
-                "and": [
-                    {
-                        "property": "Article date",
-                        "date": {"after": cutoff},
-                    },
-                    {
-                        "property": "Type",
-                        "select": {"does_not_equal": "Tool"},
-                    },
-                ]
-            },
-        )
+        pages = []
+        cursor = None
+        while True:
+            kwargs = {
+                "database_id": NOTION_DATABASE_ID,
+                "filter": {
+                    "and": [
+                        {
+                            "property": "Article date",
+                            "date": {"after": cutoff},
+                        },
+                        {
+                            "property": "Type",
+                            "select": {"does_not_equal": "Tool"},
+                        },
+                    ]
+                },
+                # Newest first: the most likely duplicates lead the prompt
+                "sorts": [{"property": "Article date", "direction": "descending"}],
+                "page_size": 100,
+            }
+            if cursor:
+                kwargs["start_cursor"] = cursor
+
+            # Paginate: a busy few days can exceed one page of results
+            result = _call(notion.databases.query, **kwargs)
+            pages.extend(result.get("results", []))
+
+            if not result.get("has_more"):
+                break
+            cursor = result.get("next_cursor")
 
         articles = []
-        for page in result.get("results", []):
+        for page in pages:
             props = page.get("properties", {})
 
             # Extract title
@@ -78,10 +189,12 @@ def get_recent_articles(days: int = 3) -> list[dict]:
             articles.append({
                 "title": title,
                 "source_url": source_url,
-                "post_text": post_text,
+                "post_text": post_text[:RECENT_POST_CHARS],
             })
 
-        return articles
+        with _recent_lock:
+            _recent_cache[days] = articles
+        return [dict(a) for a in articles]
     except Exception as e:
         log_error(f"Notion get_recent_articles failed: {e}")
         return []
@@ -116,12 +229,15 @@ def create_article_page(
         if creative_url and creative_url != "none":
             properties["Creative url"] = {"url": creative_url}
 
-        result = notion.pages.create(
+        result = _call(
+            notion.pages.create,
             parent={"database_id": NOTION_DATABASE_ID},
             properties=properties,
         )
 
         page_id = result["id"]
+        with _recent_lock:
+            _recent_cache.clear()
         log_info(f"Created Notion page: {title} ({page_id})")
         return page_id
 
@@ -142,7 +258,7 @@ def update_page_status(page_id: str, status: str, post_url: str = "") -> bool:
                 "rich_text": [{"text": {"content": post_url}}]
             }
 
-        notion.pages.update(page_id=page_id, properties=properties)
+        _call(notion.pages.update, page_id=page_id, properties=properties)
         log_info(f"Updated Notion page {page_id}: status={status}")
         return True
 
@@ -150,14 +266,25 @@ def update_page_status(page_id: str, status: str, post_url: str = "") -> bool:
         log_error(f"Notion update_page_status failed: {e}")
         return False
 
+    finally:
+        # After the update, so a concurrent read cannot re-cache the old status
+        with _page_lock:
+            _page_cache.pop(page_id, None)
+
 
 def get_article_data(page_id: str) -> dict | None:
     """
     Fetch article data from a Notion page.
     Used for stateless approval flow (recovering data from Page ID).
+    Cached for 60 seconds (see _page_cache); callers get their own copy.
     """
+    with _page_lock:
+        cached = _page_cache.get(page_id)
+    if cached is not None:
+        return dict(cached)
+
     try:
-        page = notion.pages.retrieve(page_id=page_id)
+        page = _call(notion.pages.retrieve, page_id=page_id)
         props = page.get("properties", {})
 
         # Extract fields
@@ -186,7 +313,7 @@ def get_article_data(page_id: str) -> dict | None:
         if url_prop.get("url"):
             article_url = url_prop["url"]
 
-        return {
+        data = {
             "title": title,
             "post_text": post_text,
             "creative_url": creative_url,
@@ -194,6 +321,9 @@ def get_article_data(page_id: str) -> dict | None:
             "article_url": article_url,
             "page_id": page_id,
         }
+        with _page_lock:
+            _page_cache[page_id] = data
+        return dict(data)
 
     except Exception as e:
         log_error(f"Notion get_article_data failed: {e}")
@@ -2,17 +2,103 @@
 UTIL: OpenRouter Client
 PURPOSE: Wrapper for OpenRouter API with JSON mode, structured output, retry logic,
          and model switching. All LLM calls route through here.
-DEPENDENCIES: requests
+         Low-temperature calls are cached by their inputs (utils/llm_cache), so
+         retries and re-runs of the same article skip the round trip.
+         Requests are throttled client-side (concurrency cap + requests-per-minute
+         limiter), so parallel articles queue here instead of drawing 429s.
+DEPENDENCIES: requests, orjson
 """
 
 import json
+import random
+import re
+import threading
 import time
+import orjson
 import requests
-from utils.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL
+from requests.adapters import HTTPAdapter
+from utils.config import OPENROUTER_API_KEY, OPENROUTER_BASE_URL, OPENROUTER_MAX_CONCURRENCY, OPENROUTER_RPM
 from utils.logger import log_info, log_error, log_debug
+from utils.llm_cache import CACHE, make_key
+from utils.rate_limiter import RateLimiter
 
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # seconds
+MAX_BACKOFF = 60  # seconds
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}  # Any other HTTP error fails fast
+CACHE_MAX_TEMPERATURE = 0.3  # Above this, outputs are meant to vary — never cached
+
+# Pooled keep-alive connections to openrouter.ai (no TLS handshake per call).
+# No adapter-level retries: the loop below owns retrying, and LLM calls cost money.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32, max_retries=0))
+# JSON responses compress well; urllib3 decodes "br" when the brotli package is installed
+_session.headers["Accept-Encoding"] = "br, gzip, deflate"
+
+# Markdown code fence around a JSON answer (```json ... ```), at the very start/end only
+_FENCE_RE = re.compile(r"\A\s*```[\w-]*[ \t]*\n|\n?```\s*\Z")
+
+# Client-side admission control shared by all worker threads
+_in_flight = threading.BoundedSemaphore(OPENROUTER_MAX_CONCURRENCY)
+_rate_limiter = RateLimiter(OPENROUTER_RPM, 60.0)  # Spaced evenly across threads
+
+
+class TruncatedResponseError(RuntimeError):
+    """The model hit max_tokens (finish_reason "length"); retrying with the same cap won't help."""
+
+
+def _backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """Seconds to wait before the next attempt: Retry-After if given, else exponential + jitter."""
+    try:
+        return min(MAX_BACKOFF, float(retry_after))
+    except (TypeError, ValueError):
+        return min(MAX_BACKOFF, 2 ** attempt + random.random())
+
+
+def _read_stream(resp, json_mode: bool) -> str:
+    """
+    Accumulate the content of an SSE completion stream.
+    In JSON mode, stop as soon as the first complete JSON object has arrived
+    (a trailing code fence or chatter is not waited for).
+    """
+    decoder = json.JSONDecoder()
+    parts = []
+    # Bytes, not decode_unicode: text/event-stream has no charset, so requests
+    # would guess ISO-8859-1 and garble non-ASCII (Russian) text
+    for line in resp.iter_lines():
+        if not line.startswith(b"data: "):
+            continue  # Blank separators and keep-alive comments (": OPENROUTER PROCESSING")
+        payload = line[6:]
+        if payload == b"[DONE]":
+            break
+
+        try:
+            chunk = orjson.loads(payload)
+        except orjson.JSONDecodeError as e:
+            # Transport noise, not model output: "JSON parse error" is kept for the assembled content
+            log_debug(f"OpenRouter stream: skipping malformed SSE chunk ({e}): {payload[:200]!r}")
+            continue
+        if "error" in chunk:
+            raise RuntimeError(f"OpenRouter stream error: {chunk['error']}")
+        choice = chunk["choices"][0]
+        delta = (choice.get("delta") or {}).get("content") or ""
+        parts.append(delta)
+
+        if json_mode and "}" in delta:
+            text = "".join(parts)
+            start = text.find("{")
+            if start != -1:
+                try:
+                    _, end = decoder.raw_decode(text, start)
+                    return text[start:end]
+                except json.JSONDecodeError:
+                    pass  # Object not complete yet
+
+        # Checked after the JSON test: an object that closed on the last token is still whole.
+        # Plain text cut at max_tokens is still usable and is returned as is.
+        if json_mode and choice.get("finish_reason") == "length":
+            raise TruncatedResponseError(f"Output cut off at max_tokens after {sum(map(len, parts))} chars")
+
+    return "".join(parts)
 
 
 def chat_completion(
@@ -22,6 +108,8 @@ def chat_completion(
     temperature: float = 0.7,
     max_tokens: int = 2000,
     json_mode: bool = True,
+    stream: bool = False,
+    json_schema: dict | None = None,
 ) -> dict | str:
     """
     Send a chat completion request to OpenRouter.
@@ -33,9 +121,14 @@ def chat_completion(
         temperature: Creativity vs consistency
         max_tokens: Response length limit
         json_mode: If True, parse response as JSON
+        stream: If True, stream tokens (SSE) and, in JSON mode, return as soon
+                as the JSON object is complete. Same return shape either way.
+        json_schema: JSON Schema the output must follow (strict structured output,
+                     implies json_mode). Stops padding, pre-text and code fences.
 
     Returns:
         Parsed JSON dict if json_mode=True, else raw text string.
+        Raises TruncatedResponseError (not retried) if JSON output hit max_tokens.
     """
     headers = {
         "Authorization": f"Bearer {OPENROUTER_API_KEY}",
@@ -44,61 +137,99 @@ def chat_completion(
         "X-Title": "AI Flow Daily",
     }
 
+    system_content = system_message
+    if model.startswith("anthropic/"):
+        # Anthropic caches only explicitly marked prefixes; our system prompts are
+        # constant per node, so later calls read them from cache (cheaper, lower TTFT).
+        # Gemini/OpenAI routes cache repeated prefixes automatically.
+        system_content = [{"type": "text", "text": system_message, "cache_control": {"type": "ephemeral"}}]
+
     body = {
         "model": model,
         "messages": [
-            {"role": "system", "content": system_message},
+            {"role": "system", "content": system_content},
             {"role": "user", "content": prompt},
         ],
         "temperature": temperature,
         "max_tokens": max_tokens,
     }
 
-    if json_mode:
+    if json_schema:
+        json_mode = True
+        body["response_format"] = {
+            "type": "json_schema",
+            "json_schema": {"name": "output", "strict": True, "schema": json_schema},
+        }
+    elif json_mode:
         body["response_format"] = {"type": "json_object"}
+    if stream:
+        body["stream"] = True
+
+    cache_key = None
+    if temperature <= CACHE_MAX_TEMPERATURE:
+        cache_key = make_key(model, temperature, max_tokens, json_mode, json_schema, system_message, prompt)
+        cached = CACHE.get(cache_key)
+        if cached is not None:
+            log_debug(f"OpenRouter cache hit → {model}")
+            return orjson.loads(cached) if json_mode else cached
 
     for attempt in range(1, MAX_RETRIES + 1):
+        content = ""
+        truncated = False  # Non-streamed finish_reason "length" (the stream reader raises itself)
         try:
-            log_debug(f"OpenRouter call → {model} (attempt {attempt})")
-            resp = requests.post(
-                OPENROUTER_BASE_URL,
-                headers=headers,
-                json=body,
-                timeout=120,
-            )
-            resp.raise_for_status()
-
-            data = resp.json()
-            content = data["choices"][0]["message"]["content"]
+            with _in_flight:  # Held until the body (or stream) is fully read
+                _rate_limiter.acquire()
+                log_debug(f"OpenRouter call → {model} (attempt {attempt})")
+                resp = _session.post(
+                    OPENROUTER_BASE_URL,
+                    headers=headers,
+                    json=body,
+                    timeout=120,
+                    stream=stream,
+                )
+                resp.raise_for_status()
+
+                if stream:
+                    with resp:
+                        content = _read_stream(resp, json_mode)
+                else:
+                    data = orjson.loads(resp.content)
+                    choice = data["choices"][0]
+                    truncated = choice.get("finish_reason") == "length"
+                    content = choice["message"]["content"]
 
             if json_mode:
                 # Strip markdown code fences if present
-                cleaned = content.strip()
-                if cleaned.startswith("```"):
-                    # Remove opening fence (```json or ```)
-                    first_newline = cleaned.index("\n")
-                    cleaned = cleaned[first_newline + 1 :]
-                if cleaned.endswith("```"):
-                    cleaned = cleaned[:-3]
-                return json.loads(cleaned.strip())
+                try:
+                    result = orjson.loads(_FENCE_RE.sub("", content).strip())
+                except json.JSONDecodeError:
+                    if truncated:
+                        raise TruncatedResponseError(f"Output cut off at max_tokens ({max_tokens})") from None
+                    raise
+                if cache_key:
+                    CACHE.put(cache_key, orjson.dumps(result).decode())
+                return result
 
+            if cache_key:
+                CACHE.put(cache_key, content)
             return content
 
         except requests.exceptions.HTTPError as e:
+            status = e.response.status_code if e.response is not None else None
             log_error(f"OpenRouter HTTP error (attempt {attempt}): {e}")
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY * attempt)
-            else:
+            if status not in RETRYABLE_STATUSES or attempt == MAX_RETRIES:
                 raise
-        except json.JSONDecodeError as e:
+            time.sleep(_backoff_delay(attempt, e.response.headers.get("Retry-After")))
+        except TruncatedResponseError as e:
+            log_error(f"OpenRouter response truncated ({model}): {e}")
+            raise
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
             log_error(f"JSON parse error from {model}: {e}\nRaw: {content[:500]}")
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY)
-            else:
+            if attempt == MAX_RETRIES:
                 raise
+            time.sleep(_backoff_delay(attempt))
         except Exception as e:
             log_error(f"OpenRouter error (attempt {attempt}): {e}")
-            if attempt < MAX_RETRIES:
-                time.sleep(RETRY_DELAY * attempt)
-            else:
+            if attempt == MAX_RETRIES:
                 raise
+            time.sleep(_backoff_delay(attempt))
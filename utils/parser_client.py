@@ -0,0 +1,106 @@
+"""
+UTIL: Parser Client
+PURPOSE: Shared access to the AI parser microservice (list/detail pages) and the
+         Tavily extract fallback. Used by both fetch nodes, over one pooled session.
+         Successful detail parses are cached by URL so an article seen in an RSS feed
+         and on a list page (or again on the next poll) is parsed only once.
+DEPENDENCIES: requests, orjson, cachetools
+"""
+
+import threading
+import orjson
+from cachetools import LRUCache
+
+from utils.config import AI_PARSER_URL, TAVILY_API_KEY
+from utils.logger import log_error, log_debug
+from utils.telegram_error import send_error
+from utils.http_session import SESSION, CONNECT_TIMEOUT
+
+TAVILY_EXTRACT_URL = "https://api.tavily.com/extract"
+PARSER_TIMEOUT = 120  # Read timeout — parser jobs render the page and can be slow
+TAVILY_TIMEOUT = 60
+
+_detail_cache = LRUCache(maxsize=512)
+_detail_lock = threading.Lock()
+
+
+def _parse(url: str, page_type: str, alert_node: str | None) -> dict | None:
+    """
+    Call the AI parser. Transient failures are retried by SESSION.
+    If alert_node is set, failures are also sent to the admin (logic errors as
+    `alert_node`, crashes/HTTP errors as `{alert_node}_api`).
+    """
+    try:
+        resp = SESSION.post(
+            AI_PARSER_URL,
+            json={"url": url, "page_type": page_type},
+            timeout=(CONNECT_TIMEOUT, PARSER_TIMEOUT),
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+
+        if data.get("ok") and data.get("data"):
+            return data["data"]
+
+        error_msg = data.get("error", "Unknown parser error")
+        log_error(f"Parser {page_type} page error for {url}: {error_msg}")
+        if alert_node:
+            send_error(f"Parser {page_type} page failed for {url}: {error_msg}", node_name=alert_node)
+        return None
+    except Exception as e:
+        log_error(f"AI parser {page_type} page failed for {url}: {e}")
+        if alert_node:
+            send_error(
+                f"Parser API ({page_type.title()}) failed (Crash) for {url}: {e}",
+                node_name=f"{alert_node}_api",
+            )
+        return None
+
+
+def parse_list(list_url: str, alert_node: str | None = None) -> dict | None:
+    """Get list page data ({items: [...]}) via AI parser."""
+    return _parse(list_url, "list", alert_node)
+
+
+def parse_detail(article_url: str, alert_node: str | None = None) -> dict | None:
+    """Get article detail ({full_text, images, videos}) via AI parser. Cached on success."""
+    with _detail_lock:
+        cached = _detail_cache.get(article_url)
+    if cached is not None:
+        log_debug(f"Parser cache hit: {article_url}")
+        return cached
+
+    data = _parse(article_url, "detail", alert_node)
+    if data:
+        with _detail_lock:
+            _detail_cache[article_url] = data
+    return data
+
+
+def tavily_extract(article_url: str) -> dict | None:
+    """Fallback: use Tavily to extract article content."""
+    if not TAVILY_API_KEY:
+        log_debug("Tavily API key not set, skipping fallback")
+        return None
+
+    try:
+        resp = SESSION.post(
+            TAVILY_EXTRACT_URL,
+            json={"api_key": TAVILY_API_KEY, "urls": [article_url]},
+            timeout=(CONNECT_TIMEOUT, TAVILY_TIMEOUT),
+        )
+        resp.raise_for_status()
+        data = orjson.loads(resp.content)
+
+        results = data.get("results", [])
+        if results:
+            return {
+                "full_text": results[0].get("raw_content", ""),
+                "url": results[0].get("url", article_url),
+                "images": [],
+                "videos": [],
+            }
+        return None
+    except Exception as e:
+        log_error(f"Tavily extract failed for {article_url}: {e}")
+        return None
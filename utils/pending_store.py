@@ -0,0 +1,70 @@
+"""
+UTIL: Pending Store
+PURPOSE: Persistent store for posts awaiting admin approval (callback_id → article data),
+         backed by a single SQLite table so pending approvals survive a restart.
+         Entries expire after a TTL; expired rows are purged on startup and
+         ignored on read (Notion remains the fallback for anything missing).
+DEPENDENCIES: sqlite3 (stdlib), orjson
+"""
+
+import sqlite3
+import threading
+import time
+
+import orjson
+
+from utils.logger import log_debug
+
+
+class PendingStore:
+    """Small dict-like wrapper (get/put/pop) around a SQLite table."""
+
+    def __init__(self, path: str, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pending ("
+            "callback_id TEXT PRIMARY KEY, data TEXT NOT NULL, created_at REAL NOT NULL)"
+        )
+        self.cleanup()
+
+    def cleanup(self) -> None:
+        """Delete expired entries."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM pending WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+        if cur.rowcount:
+            log_debug(f"[Pending] Purged {cur.rowcount} expired approval(s)")
+
+    def put(self, callback_id: str, data: dict) -> None:
+        """Store (or replace) the data for a callback ID."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pending (callback_id, data, created_at) VALUES (?, ?, ?)",
+                (callback_id, orjson.dumps(data).decode(), time.time()),
+            )
+
+    def get(self, callback_id: str, default=None) -> dict | None:
+        """Return the data for a callback ID, or default if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM pending WHERE callback_id = ? AND created_at >= ?",
+                (callback_id, time.time() - self.ttl),
+            ).fetchone()
+        return orjson.loads(row[0]) if row else default
+
+    def pop(self, callback_id: str, default=None) -> dict | None:
+        """Remove and return the data for a callback ID, or default if missing/expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data, created_at FROM pending WHERE callback_id = ?", (callback_id,)
+            ).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM pending WHERE callback_id = ?", (callback_id,))
+        if not row or row[1] < time.time() - self.ttl:
+            return default
+        return orjson.loads(row[0])
@@ -0,0 +1,41 @@
+"""
+UTIL: Rate Limiter
+PURPOSE: Process-wide, thread-safe rate limiter shared by every caller of an API.
+         Calls are spaced evenly so concurrent threads stay under the provider's
+         limit instead of bursting into 429s.
+"""
+
+import threading
+import time
+
+
+class RateLimiter:
+    """Allow at most `rate` calls per `period` seconds across all threads.
+
+    Usage:
+        limiter = RateLimiter(3, 1.0)
+        with limiter:
+            call_api()
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self._interval = period / rate
+        self._next_slot = 0.0  # time.monotonic() of the next free slot
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may issue its request."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+
+        if wait > 0:
+            time.sleep(wait)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        return False
@@ -4,11 +4,16 @@ PURPOSE: Sends error alerts to admin Telegram channel for monitoring.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 from utils.config import TELEGRAM_BOT_TOKEN, ADMIN_USER_ID
 from utils.logger import log_error
 
 PROJECT_NAME = "AI Flow Daily"
 
+# Keep-alive connection to api.telegram.org; alerts tend to come in bursts
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=8, max_retries=0))
+
 
 def send_error(error_message: str, node_name: str = "Unknown") -> None:
     """Send error notification directly to admin's Telegram DM."""
@@ -20,7 +25,7 @@ def send_error(error_message: str, node_name: str = "Unknown") -> None:
 
     try:
         url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-        resp = requests.post(
+        resp = _session.post(
             url,
             json={
                 "chat_id": ADMIN_USER_ID,
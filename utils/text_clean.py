@@ -0,0 +1,72 @@
+"""
+UTIL: Text Clean
+PURPOSE: Strip what fetched article text carries besides the article — HTML
+         leftovers, script/style blocks, cookie/newsletter/share banners and
+         runs of whitespace — in the fetch nodes, before the text is cut to
+         MAX_ARTICLE_CHARS, so the kept characters (and LLM tokens) are content.
+         Works line by line: only lines that are a banner in their entirety are
+         dropped; sentences that mention a privacy policy or "read more" stay.
+DEPENDENCIES: re (stdlib)
+"""
+
+import html
+import re
+
+BOILERPLATE_MAX_CHARS = 160  # Banners are short; longer lines are treated as content
+
+_SCRIPT_STYLE = re.compile(r"<(script|style|noscript)\b[^>]*>.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r"</?[a-zA-Z][^>]*>")
+_SPACES = re.compile(r"[ \t\f\v\u00a0]+")  # Incl. no-break spaces
+_BLANK_LINES = re.compile(r"\n{3,}")
+# Whole-line banners only (anchored): "Meta changed its terms of service" is news and stays
+_BANNER_LINE = re.compile(
+    r"(?:advertisement|sponsored(?: content)?|read more|continue reading|recommended for you|"
+    r"related (?:articles?|stories|posts|reading)|share (?:this(?: article| story| post)?|on \w+)|"
+    r"follow us(?: on \w+)?|privacy policy|terms of (?:use|service)|cookie (?:policy|settings|preferences)|"
+    r"accept (?:all )?cookies|(?:©|copyright)[^\n]*all rights reserved)\W*",
+    re.IGNORECASE,
+)
+# Consent/newsletter prompts: a short line that *starts* with the site addressing the reader
+_BANNER_PREFIX = re.compile(
+    r"(?:we use cookies|this (?:web)?site uses cookies|subscribe to our newsletter|"
+    r"sign up for our newsletter)\b",
+    re.IGNORECASE,
+)
+
+
+def _is_boilerplate(line: str) -> bool:
+    if len(line) > BOILERPLATE_MAX_CHARS:
+        return False
+    return _BANNER_LINE.fullmatch(line) is not None or _BANNER_PREFIX.match(line) is not None
+
+
+def clean(text: str) -> str:
+    """Return article text without markup, banner lines and redundant whitespace."""
+    if "<" in text:
+        text = _TAG.sub(" ", _SCRIPT_STYLE.sub(" ", text))
+    if "&" in text:
+        text = html.unescape(text)
+
+    lines = []
+    for line in _SPACES.sub(" ", text).splitlines():
+        line = line.strip()
+        if line and _is_boilerplate(line):
+            continue
+        lines.append(line)
+
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+# ── Standalone test ──────────────────────────────────────────
+if __name__ == "__main__":
+    sample = (
+        "<script>track()</script>We use cookies to improve your experience\n\n\n\n"
+        "OpenAI   released a new model today.&nbsp;It is faster.\n"
+        "Subscribe to our newsletter\n"
+        "Users can sign up for the waitlist today.\n"
+        "Anthropic updated its privacy policy for API customers.\n"
+        "The model can read more than 1M tokens.\n"
+        "Share on X\n"
+        "Read more →"
+    )
+    print(clean(sample))
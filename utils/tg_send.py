@@ -0,0 +1,78 @@
+"""
+UTIL: Telegram Send
+PURPOSE: One place that posts a finished post to a chat, dispatching on creative type
+         (video / image / text-only). Used by the admin preview, the main channel
+         and the RU channel. Images are sent as resized bytes (cached per URL, see
+         utils/http_async) to bypass Telegram fetch errors, falling back to the URL.
+DEPENDENCIES: python-telegram-bot, aiohttp (via utils/http_async)
+"""
+
+from io import BytesIO
+
+from utils.http_async import fetch_resized
+from utils.logger import log_error
+
+
+def _has_creative(creative_url: str | None) -> bool:
+    return bool(creative_url) and creative_url != "none"
+
+
+async def _send_image(bot, chat_id, post_text: str, image_url: str, photo_name: str, insecure_fallback: bool):
+    """Send the resized image bytes; on any failure, let Telegram fetch the URL itself."""
+    try:
+        photo = BytesIO(await fetch_resized(image_url, insecure_fallback=insecure_fallback))
+        photo.name = photo_name
+        return await bot.send_photo(chat_id=chat_id, photo=photo, caption=post_text, parse_mode="HTML")
+    except Exception as e:
+        log_error(f"[Telegram] Image upload failed for {chat_id}, trying plain URL: {e}")
+        return await bot.send_photo(chat_id=chat_id, photo=image_url, caption=post_text, parse_mode="HTML")
+
+
+async def _send_text(bot, chat_id, text: str):
+    return await bot.send_message(
+        chat_id=chat_id,
+        text=text,
+        parse_mode="HTML",
+        disable_web_page_preview=True,
+    )
+
+
+async def send_post(
+    bot,
+    chat_id,
+    post_text: str,
+    creative_type: str,
+    creative_url: str,
+    photo_name: str = "cover.jpg",
+    text_fallback: bool = False,
+    insecure_fallback: bool = False,
+):
+    """
+    Send a post with its creative.
+
+    Args:
+        bot: telegram.Bot instance
+        creative_type: "video"|"image"|"none"
+        creative_url: URL or "none"
+        photo_name: File name for uploaded image bytes
+        text_fallback: If the image cannot be sent at all, send the text alone
+                       (with a note) instead of raising
+        insecure_fallback: Retry the image download without certificate
+                           verification on a certificate error
+
+    Returns:
+        The sent telegram.Message. Raises on Telegram errors.
+    """
+    if creative_type == "video" and _has_creative(creative_url):
+        return await bot.send_video(chat_id=chat_id, video=creative_url, caption=post_text, parse_mode="HTML")
+
+    if creative_type == "image" and _has_creative(creative_url):
+        try:
+            return await _send_image(bot, chat_id, post_text, creative_url, photo_name, insecure_fallback)
+        except Exception as e:
+            if not text_fallback:
+                raise
+            log_error(f"[Telegram] Photo URL also failed for {chat_id}, sending text only: {e}")
+            return await _send_text(bot, chat_id, f"[Image omitted due to fetch error]\n\n{post_text}")
+
+    return await _send_text(bot, chat_id, post_text)